@@ -1,20 +1,33 @@
+import os
 import sys
 
-if __name__ == "__main__":
+
+def main(argv):
+    """
+    Prints the program name and every argument it received.
+    """
     print("=== Command Quest ===")
 
-    value: int = 1
     count: int = 1
-    len_args: int = len(sys.argv)
+    len_args: int = len(argv)
     if len_args == 1:
         print("No arguments provided!")
-        print(f"Program name: {sys.argv[0]}")
+        print(f"Program name: {argv[0]}")
     else:
-        print(f"Program name: {sys.argv[0]}")
+        print(f"Program name: {argv[0]}")
         print(f"Arguments received: {len_args - 1}")
 
-    for value in sys.argv[1:]:
+    for value in argv[1:]:
         print(f"Argument {count}: {value}")
         count += 1
 
     print(f"Total arguments: {len_args}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+        __file__))))
+    from ft_cli import run
+
+    sys.exit(run(main))
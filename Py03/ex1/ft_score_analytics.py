@@ -1,35 +1,94 @@
+import os
 import sys
 
-if __name__ == "__main__":
+USAGE = ("Usage: python3 ft_score_analytics.py <score1> <score2> ...\n"
+         "       python3 ft_score_analytics.py --file <path|-> ... "
+         "[--quantiles=50,90,99]")
+
+
+def stream_score_analytics(paths, quantiles=None):
+    """
+    Prints the score analytics of files ("-" for stdin) read in large
+    buffered chunks, in one pass and constant memory. Each file gets its
+    own stats and quantile sketch, merged into the totals.
+
+    Returns:
+        int: 0 on success, 1 when a file cannot be read or holds no score
+    """
+    from score_stream import ScoreStats, read_score_files
+
+    stats = ScoreStats(quantiles=bool(quantiles))
+    try:
+        for path in paths:
+            shard = ScoreStats(quantiles=bool(quantiles))
+            for values in read_score_files([path]):
+                shard.update(values)
+            stats.merge(shard)
+    except (OSError, ValueError) as e:
+        print(f"Error reading scores: {e}")
+        return 1
+    if stats.count == 0:
+        print("No scores provided.")
+        return 1
+
+    print(f"Total players: {stats.count}")
+    print(f"Total score: {stats.total}")
+    print(f"Average score: {stats.mean()}")
+    print(f"High score: {stats.high}")
+    print(f"Low score: {stats.low}")
+    print(f"Score range: {stats.score_range()}")
+    for q in quantiles or ():
+        print(f"p{q:g} score: {stats.quantile(q / 100)}")
+    return 0
+
+
+def main(argv):
+    """
+    Prints the analytics of the scores given as arguments, or of score
+    files with --file.
+    """
     print("=== Player Score Analytics ===")
 
-    value: int = 1
-    i: int = 0
-    total_players: int = len(sys.argv) - 1
-    total_scor: int = 0
+    if len(argv) > 1 and argv[1] in ("-f", "--file"):
+        paths: list[str] = []
+        quantiles: list[float] = []
+        for value in argv[2:]:
+            if value.startswith("--quantiles="):
+                try:
+                    quantiles = [float(q) for q in value[12:].split(",")]
+                except ValueError:
+                    quantiles = []
+                if not quantiles or not all(0 <= q <= 100
+                                            for q in quantiles):
+                    print(f"Invalid quantiles: {value[12:]!r} "
+                          "(expected percentages between 0 and 100)\n"
+                          f"{USAGE}")
+                    return 1
+            else:
+                paths.append(value)
+        return stream_score_analytics(paths or ["-"], quantiles)
 
     try:
-        for value in sys.argv[1:]:
-            total_scor += int(value)
-        res = total_scor / total_players
+        scores: list[int] = [int(value) for value in argv[1:]]
+        res = sum(scores) / len(scores)
     except Exception:
-        print("No scores provided. Usage: python3 ft_score_analytics.py "
-              "<score1> <score2> ...")
-    else:
-        my_list: list[int] = []
-        print("Scores processed: [", end="")
-
-        for value in sys.argv[1:]:
-            print(value, end="")
-            if i != total_players - 1:
-                print(', ', end="")
-            my_list.append(int(value))
-            i += 1
-
-        print("]")
-        print(f"Total players: {total_players}")
-        print(f"Total score: {total_scor}")
-        print(f"Average score: {res}")
-        print(f"High score: {max(my_list)}")
-        print(f"Low score: {min(my_list)}")
-        print(f"Score range: {max(my_list) - min(my_list)}")
+        print(f"No scores provided. {USAGE}")
+        return 1
+    high: int = max(scores)
+    low: int = min(scores)
+    print(f"Scores processed: [{', '.join(argv[1:])}]")
+    print(f"Total players: {len(scores)}")
+    print(f"Total score: {sum(scores)}")
+    print(f"Average score: {res}")
+    print(f"High score: {high}")
+    print(f"Low score: {low}")
+    print(f"Score range: {high - low}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+        __file__))))
+    from ft_cli import run
+
+    sys.exit(run(main))
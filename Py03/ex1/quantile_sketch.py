@@ -0,0 +1,151 @@
+from math import ceil
+from random import Random
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_K = 200
+DEFAULT_C = 2 / 3
+
+
+class KLLSketch:
+    """
+    KLL streaming quantile sketch.
+
+    Items go through a stack of compactors; compactor h holds items of
+    weight 2 ** h and, when full, sorts itself and promotes every other
+    item to the level above. Memory stays around k / (1 - c) items and
+    the rank error is about 1.7 / k, whatever the stream length.
+    Sketches built on different shards or files can be merged.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, c: float = DEFAULT_C,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty sketch of accuracy parameter k.
+        """
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.rng = Random(seed)
+        self.compactors: List[List[Any]] = []
+        self.max_size = 0
+        self._grow()
+
+    def _grow(self) -> None:
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h)
+                            for h in range(len(self.compactors)))
+
+    def _capacity(self, h: int) -> int:
+        height = len(self.compactors) - h - 1
+        return int(ceil(self.c ** height * self.k)) + 1
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _compress(self) -> None:
+        while self._size() >= self.max_size:
+            for h in range(len(self.compactors)):
+                compactor = self.compactors[h]
+                if len(compactor) < self._capacity(h):
+                    continue
+                if h + 1 == len(self.compactors):
+                    self._grow()
+                compactor.sort()
+                keep = [compactor.pop()] if len(compactor) % 2 else []
+                offset = self.rng.random() < 0.5
+                self.compactors[h + 1].extend(compactor[offset::2])
+                compactor[:] = keep
+                if self._size() < self.max_size:
+                    break
+
+    def update(self, value: Any) -> None:
+        """
+        Add one value to the sketch.
+        """
+        self.compactors[0].append(value)
+        self.n += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def update_many(self, values: Iterable[Any]) -> None:
+        """
+        Add a batch of values, compressing once for the whole batch.
+        """
+        level = self.compactors[0]
+        before = len(level)
+        level.extend(values)
+        self.n += len(level) - before
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Fold another sketch into this one.
+        """
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for h, compactor in enumerate(other.compactors):
+            self.compactors[h].extend(compactor)
+        self.n += other.n
+        self._compress()
+
+    def _weighted(self) -> List[tuple]:
+        return sorted((value, 1 << h)
+                      for h, compactor in enumerate(self.compactors)
+                      for value in compactor)
+
+    def rank(self, value: Any) -> float:
+        """
+        Estimated fraction of the values <= value.
+        """
+        weight = total = 0
+        for item, w in self._weighted():
+            total += w
+            if item <= value:
+                weight += w
+        return weight / total if total else 0.0
+
+    def quantile(self, q: float) -> Any:
+        """
+        Estimated value at quantile q (0 <= q <= 1).
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: List[float]) -> List[Any]:
+        """
+        Estimated values at several quantiles, with one sort.
+        """
+        weighted = self._weighted()
+        if not weighted:
+            raise ValueError("empty sketch")
+        total = sum(w for _, w in weighted)
+        result = []
+        for q in qs:
+            target = q * total
+            cumulative = 0
+            answer = weighted[-1][0]
+            for value, w in weighted:
+                cumulative += w
+                if cumulative >= target:
+                    answer = value
+                    break
+            result.append(answer)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializable form of the sketch, for shipping shards around.
+        """
+        return {"k": self.k, "c": self.c, "n": self.n,
+                "compactors": [list(c) for c in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        """
+        Rebuild a sketch from its to_dict() form.
+        """
+        sketch = cls(data["k"], data["c"])
+        sketch.n = data["n"]
+        sketch.compactors = [list(c) for c in data["compactors"]]
+        sketch.max_size = sum(sketch._capacity(h)
+                              for h in range(len(sketch.compactors)))
+        return sketch
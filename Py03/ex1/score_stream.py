@@ -0,0 +1,116 @@
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from quantile_sketch import DEFAULT_K, KLLSketch
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_score_chunks(stream: BinaryIO,
+                      chunk_size: int = CHUNK_SIZE) -> Iterator[List[int]]:
+    """
+    Generator of score batches read from a binary stream.
+
+    The stream is read in large chunks and each chunk is converted in one
+    map(int, ...) call; a token cut at a chunk boundary is carried over
+    to the next chunk. Scores may be separated by any whitespace.
+
+    Yields:
+        list[int]: The scores of the next chunk
+    """
+    carry = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        chunk = carry + chunk
+        cut = max(chunk.rfind(b" "), chunk.rfind(b"\n"),
+                  chunk.rfind(b"\t"), chunk.rfind(b"\r"))
+        if cut == -1:
+            carry = chunk
+            continue
+        carry = chunk[cut + 1:]
+        values = list(map(int, chunk[:cut].split()))
+        if values:
+            yield values
+    if carry.strip():
+        yield list(map(int, carry.split()))
+
+
+def read_score_files(paths: Iterable[str],
+                     chunk_size: int = CHUNK_SIZE) -> Iterator[List[int]]:
+    """
+    Generator of score batches over several files, "-" meaning stdin.
+
+    Yields:
+        list[int]: The scores of the next chunk
+    """
+    for path in paths:
+        if path == "-":
+            yield from read_score_chunks(sys.stdin.buffer, chunk_size)
+        else:
+            with open(path, "rb") as f:
+                yield from read_score_chunks(f, chunk_size)
+
+
+class ScoreStats:
+    """
+    One-pass, constant-memory statistics over batches of scores.
+
+    Quantiles are estimated with a KLL sketch when requested; stats of
+    different files or shards can be merged.
+    """
+
+    def __init__(self, quantiles: bool = False, k: int = DEFAULT_K,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize empty statistics.
+        """
+        self.count = 0
+        self.total = 0
+        self.low: Optional[int] = None
+        self.high: Optional[int] = None
+        self.sketch: Optional[KLLSketch] = (KLLSketch(k, seed=seed)
+                                            if quantiles else None)
+
+    def update(self, values: List[int]) -> None:
+        """
+        Account one batch of scores.
+        """
+        if not values:
+            return
+        self._bounds(min(values), max(values))
+        if self.sketch is not None:
+            self.sketch.update_many(values)
+        self.count += len(values)
+        self.total += sum(values)
+
+    def _bounds(self, low: Optional[int], high: Optional[int]) -> None:
+        if low is not None and (self.low is None or low < self.low):
+            self.low = low
+        if high is not None and (self.high is None or high > self.high):
+            self.high = high
+
+    def merge(self, other: "ScoreStats") -> None:
+        """
+        Fold the statistics of another file or shard into these.
+        """
+        self._bounds(other.low, other.high)
+        self.count += other.count
+        self.total += other.total
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def mean(self) -> float:
+        return self.total / self.count
+
+    def score_range(self) -> int:
+        return self.high - self.low
+
+    def quantile(self, q: float) -> int:
+        """
+        Estimated score at quantile q (0 <= q <= 1).
+        """
+        if self.sketch is None:
+            raise ValueError("no quantile data collected")
+        return self.sketch.quantile(q)
@@ -0,0 +1,100 @@
+from array import array
+from heapq import nsmallest
+from itertools import repeat
+from math import hypot
+from operator import sub
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float, float]
+
+
+class PointBatch:
+    """
+    Batch of 3D positions stored as three contiguous float columns.
+
+    Distances are computed column-wise with map() over the arrays, so the
+    per-point arithmetic runs in C instead of a Python loop body.
+    """
+
+    def __init__(self, xs: Sequence[float] = (), ys: Sequence[float] = (),
+                 zs: Sequence[float] = ()) -> None:
+        """
+        Initialize a batch from its x, y and z columns.
+        """
+        if not len(xs) == len(ys) == len(zs):
+            raise ValueError("x, y and z columns must have the same length")
+        self.xs = array("d", xs)
+        self.ys = array("d", ys)
+        self.zs = array("d", zs)
+
+    @classmethod
+    def parse(cls, text: str) -> "PointBatch":
+        """
+        Parse "x,y,z" positions separated by whitespace or newlines.
+        """
+        flat = array("d", map(float, text.replace(",", " ").split()))
+        if len(flat) % 3:
+            raise ValueError(f"{len(flat)} values do not form 3D points")
+        return cls(flat[0::3], flat[1::3], flat[2::3])
+
+    @classmethod
+    def from_file(cls, path: str) -> "PointBatch":
+        """
+        Read a coordinate file with one "x,y,z" position per line.
+        """
+        with open(path, "r") as f:
+            return cls.parse(f.read())
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def point(self, i: int) -> Point:
+        return self.xs[i], self.ys[i], self.zs[i]
+
+    def distances_to(self, point: Point) -> array:
+        """
+        Distance of every position to one point.
+        """
+        x, y, z = point
+        return array("d", map(hypot, map(sub, self.xs, repeat(x)),
+                              map(sub, self.ys, repeat(y)),
+                              map(sub, self.zs, repeat(z))))
+
+    def nearest(self, point: Point, k: int = 1) -> List[Tuple[int, float]]:
+        """
+        The k (index, distance) pairs closest to point, closest first.
+        """
+        distances = self.distances_to(point)
+        return [(i, distances[i])
+                for i in nsmallest(k, range(len(distances)),
+                                   key=distances.__getitem__)]
+
+    def pairwise(self) -> List[array]:
+        """
+        Full distance matrix, one row array per position: O(n^2) time
+        and memory, meant for small batches.
+        """
+        return [self.distances_to(self.point(i)) for i in range(len(self))]
+
+    def nearest_neighbours(self) -> List[Tuple[int, float]]:
+        """
+        For every position, the (index, distance) of its closest other
+        position; (-1, inf) when the batch has a single point.
+
+        Each query goes to a KDTree built once over the batch, so the
+        whole pass is O(n log n) on spread-out data instead of one full
+        distance row per point.
+        """
+        from spatial_index import KDTree
+
+        points = [self.point(i) for i in range(len(self))]
+        tree = KDTree(enumerate(points))
+        result = []
+        for i, point in enumerate(points):
+            for j, distance in tree.nearest(point, 2):
+                if j != i:
+                    result.append((j, distance))
+                    break
+            else:
+                result.append((-1, float("inf")))
+        return result
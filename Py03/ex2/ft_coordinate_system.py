@@ -1,11 +1,52 @@
-import sys
 import math
+import os
+import sys
 
 
-if __name__ == "__main__":
+def batch_distances(path, origin=(0.0, 0.0, 0.0)):
+    """
+    Loads a coordinate file into a PointBatch and prints the distances
+    to origin and the closest pair of positions.
+    """
+    from distance_engine import PointBatch
+    from spatial_index import KDTree
+
+    try:
+        batch = PointBatch.from_file(path)
+    except (OSError, ValueError) as e:
+        print(f"Error loading coordinates: {e}")
+        return
+    print(f"Positions loaded: {len(batch)}")
+    if not batch:
+        return
+    distances = batch.distances_to(origin)
+    print(f"Average distance to {origin}: {sum(distances) / len(batch):.2f}")
+    for i, distance in batch.nearest(origin, 3):
+        print(f"Closest: {batch.point(i)} at {distance:.2f}")
+    if len(batch) > 1:
+        tree = KDTree((i, batch.point(i)) for i in range(len(batch)))
+        pairs = [(tree.nearest(batch.point(i), 2)[1], i)
+                 for i in range(len(batch))]
+        (j, distance), i = min(pairs, key=lambda pair: pair[0][1])
+        print(f"Closest pair: {batch.point(i)} and "
+              f"{batch.point(j)} ({distance:.2f})")
+
+
+def main(argv):
+    """
+    Parses one "x,y,z" position and prints its distance to the origin,
+    or analyzes a coordinate file with --file.
+    """
     print("=== Game Coordinate System ===")
     print()
-    data: str = sys.argv[1]
+    if len(argv) > 2 and argv[1] in ("-f", "--file"):
+        batch_distances(argv[2])
+        return 0
+    if len(argv) < 2:
+        print("Usage: python3 ft_coordinate_system.py <x,y,z>\n"
+              "       python3 ft_coordinate_system.py --file <path>")
+        return 1
+    data: str = argv[1]
     list_to_convert: list[str] = data.split(',')
     new_tuple: tuple = tuple(list_to_convert)
 
@@ -17,12 +58,21 @@ if __name__ == "__main__":
         print(f"Parsing invalid coordinates: \"{data}\"")
         print(f"Error parsing coordinates: {e}")
         print(f"Error details - Type: ValueError, Args: ({e},)")
-    else:
-        print(f"Parsing coordinates: \"{data}\"")
-        print(f"Parsed position: ({x1}, {y1}, {z1})")
-        print(f"Distance between ({x2}, {y2}, {z2}) and ({x1}, {y1}, {z1}):"
-              f"{distance:.2f}")
-        print()
-        print("Unpacking demonstration:")
-        print(f"Player at x={x1}, y={y1}, z={z1}\nCoordinates: "
-              f"X={x1}, Y={y1}, Z={z1}")
+        return 1
+    print(f"Parsing coordinates: \"{data}\"")
+    print(f"Parsed position: ({x1}, {y1}, {z1})")
+    print(f"Distance between ({x2}, {y2}, {z2}) and ({x1}, {y1}, {z1}):"
+          f"{distance:.2f}")
+    print()
+    print("Unpacking demonstration:")
+    print(f"Player at x={x1}, y={y1}, z={z1}\nCoordinates: "
+          f"X={x1}, Y={y1}, Z={z1}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+        __file__))))
+    from ft_cli import run
+
+    sys.exit(run(main))
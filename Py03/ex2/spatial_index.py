@@ -0,0 +1,235 @@
+from heapq import heappush, heappushpop, nsmallest
+from math import floor, sqrt
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+Point = Tuple[float, float, float]
+Cell = Tuple[int, int, int]
+
+
+def _dist2(a: Point, b: Point) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class KDTree:
+    """
+    Static 3D k-d tree over (id, point) entries.
+
+    The tree is implicit: entries are reordered so that the median of
+    every [lo, hi) slice sits at (lo + hi) // 2, split on x, y, z in turn.
+    Range and k-nearest queries prune whole slices and run in sub-linear
+    time on spread-out data.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, Point]]) -> None:
+        """
+        Build the tree from (id, point) pairs in O(n log^2 n).
+        """
+        self.entries: List[Tuple[Hashable, Point]] = list(entries)
+        stack = [(0, len(self.entries), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if hi - lo <= 1:
+                continue
+            self.entries[lo:hi] = sorted(self.entries[lo:hi],
+                                         key=lambda entry: entry[1][axis])
+            mid = (lo + hi) // 2
+            nxt = (axis + 1) % 3
+            stack.append((lo, mid, nxt))
+            stack.append((mid + 1, hi, nxt))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def within(self, point: Point,
+               radius: float) -> List[Tuple[Hashable, float]]:
+        """
+        (id, distance) of every entry within radius of point.
+        """
+        r2 = radius * radius
+        found = []
+        stack = [(0, len(self.entries), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            ident, p = self.entries[mid]
+            d2 = _dist2(point, p)
+            if d2 <= r2:
+                found.append((ident, sqrt(d2)))
+            diff = point[axis] - p[axis]
+            nxt = (axis + 1) % 3
+            if diff <= radius:
+                stack.append((lo, mid, nxt))
+            if diff >= -radius:
+                stack.append((mid + 1, hi, nxt))
+        return found
+
+    def nearest(self, point: Point,
+                k: int = 1) -> List[Tuple[Hashable, float]]:
+        """
+        The k (id, distance) pairs closest to point, closest first.
+        """
+        if k <= 0:
+            return []
+        best: List[Tuple[float, int]] = []
+        stack = [(0, len(self.entries), 0, 0.0)]
+        while stack:
+            lo, hi, axis, bound = stack.pop()
+            if lo >= hi or (len(best) == k and bound > -best[0][0]):
+                continue
+            mid = (lo + hi) // 2
+            p = self.entries[mid][1]
+            d2 = _dist2(point, p)
+            if len(best) < k:
+                heappush(best, (-d2, mid))
+            elif d2 < -best[0][0]:
+                heappushpop(best, (-d2, mid))
+            diff = point[axis] - p[axis]
+            nxt = (axis + 1) % 3
+            if diff <= 0:
+                stack.append((mid + 1, hi, nxt, diff * diff))
+                stack.append((lo, mid, nxt, 0.0))
+            else:
+                stack.append((lo, mid, nxt, diff * diff))
+                stack.append((mid + 1, hi, nxt, 0.0))
+        return [(self.entries[i][0], sqrt(-d2))
+                for d2, i in sorted(best, reverse=True)]
+
+
+class UniformGrid:
+    """
+    Uniform 3D grid of cubic cells for moving entities.
+
+    Inserting, moving and removing an entity are O(1) dict operations;
+    queries only look at the cells around the query point.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initialize an empty grid of cells of the given edge length.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Set[Hashable]] = {}
+        self.positions: Dict[Hashable, Point] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _cell(self, point: Point) -> Cell:
+        size = self.cell_size
+        return (floor(point[0] / size), floor(point[1] / size),
+                floor(point[2] / size))
+
+    def insert(self, ident: Hashable, point: Point) -> None:
+        """
+        Add an entity, or move it when it is already in the grid.
+        """
+        if ident in self.positions:
+            self.move(ident, point)
+            return
+        self.positions[ident] = point
+        self.cells.setdefault(self._cell(point), set()).add(ident)
+
+    def move(self, ident: Hashable, point: Point) -> None:
+        """
+        Update the position of an entity, changing cell only if needed.
+        """
+        old = self._cell(self.positions[ident])
+        new = self._cell(point)
+        self.positions[ident] = point
+        if old != new:
+            self._discard(old, ident)
+            self.cells.setdefault(new, set()).add(ident)
+
+    def remove(self, ident: Hashable) -> None:
+        """
+        Drop an entity from the grid.
+        """
+        self._discard(self._cell(self.positions.pop(ident)), ident)
+
+    def _discard(self, cell: Cell, ident: Hashable) -> None:
+        members = self.cells[cell]
+        members.discard(ident)
+        if not members:
+            del self.cells[cell]
+
+    def within(self, point: Point,
+               radius: float) -> List[Tuple[Hashable, float]]:
+        """
+        (id, distance) of every entity within radius of point.
+        """
+        r2 = radius * radius
+        low = self._cell((point[0] - radius, point[1] - radius,
+                          point[2] - radius))
+        high = self._cell((point[0] + radius, point[1] + radius,
+                           point[2] + radius))
+        span = ((high[0] - low[0] + 1) * (high[1] - low[1] + 1)
+                * (high[2] - low[2] + 1))
+        if span > len(self.cells):
+            cells = [cell for cell in self.cells
+                     if all(low[i] <= cell[i] <= high[i] for i in range(3))]
+        else:
+            cells = [(cx, cy, cz)
+                     for cx in range(low[0], high[0] + 1)
+                     for cy in range(low[1], high[1] + 1)
+                     for cz in range(low[2], high[2] + 1)]
+        found = []
+        for cell in cells:
+            for ident in self.cells.get(cell, ()):
+                d2 = _dist2(point, self.positions[ident])
+                if d2 <= r2:
+                    found.append((ident, sqrt(d2)))
+        return found
+
+    def _shell(self, center: Cell, s: int) -> Iterable[Cell]:
+        cx, cy, cz = center
+        for dx in range(-s, s + 1):
+            for dy in range(-s, s + 1):
+                if abs(dx) == s or abs(dy) == s:
+                    dzs = range(-s, s + 1)
+                else:
+                    dzs = (-s, s) if s else (0,)
+                for dz in dzs:
+                    yield cx + dx, cy + dy, cz + dz
+
+    def nearest(self, point: Point,
+                k: int = 1) -> List[Tuple[Hashable, float]]:
+        """
+        The k (id, distance) pairs closest to point, closest first.
+
+        Cells are visited in growing shells around the point's cell and
+        the search stops once no unvisited cell can hold a closer entity.
+        When the shells would cover more cells than are occupied, the
+        entities are scanned directly instead.
+        """
+        k = min(k, len(self.positions))
+        if k <= 0:
+            return []
+        center = self._cell(point)
+        candidates: List[Tuple[float, Hashable]] = []
+        seen = 0
+        s = 0
+        while True:
+            if (2 * s + 1) ** 3 > 2 * len(self.cells):
+                candidates = [(_dist2(point, p), ident)
+                              for ident, p in self.positions.items()]
+                candidates = nsmallest(k, candidates,
+                                       key=lambda pair: pair[0])
+                break
+            for cell in self._shell(center, s):
+                for ident in self.cells.get(cell, ()):
+                    candidates.append(
+                        (_dist2(point, self.positions[ident]), ident))
+                    seen += 1
+            if len(candidates) >= k:
+                candidates = nsmallest(k, candidates,
+                                       key=lambda pair: pair[0])
+                reach = s * self.cell_size
+                if (candidates[-1][0] <= reach * reach
+                        or seen == len(self.positions)):
+                    break
+            s += 1
+        return [(ident, sqrt(d2)) for d2, ident in candidates]
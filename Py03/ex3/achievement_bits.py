@@ -0,0 +1,168 @@
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+def popcount(mask: int) -> int:
+    """
+    Number of bits set in mask.
+    """
+    return bin(mask).count("1")
+
+
+class AchievementIndex:
+    """
+    Achievements interned into bit positions, one integer bitmask per
+    player.
+
+    Per-bit holder counts, and a count -> bits frequency index, are kept
+    on every grant or revoke, so unions, intersections and rarity counts
+    never rebuild sets. Observers registered with subscribe() get
+    player_changed(name, old_mask, new_mask) after every change.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty index.
+        """
+        self.bits: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.players: Dict[str, int] = {}
+        self.counts: List[int] = []
+        self.by_count: Dict[int, Set[int]] = {}
+        self.observers: List[Any] = []
+
+    def subscribe(self, observer: Any) -> None:
+        """
+        Register an observer notified of every player mask change.
+        """
+        self.observers.append(observer)
+
+    def _changed(self, name: str, old: int, new: int) -> None:
+        for observer in self.observers:
+            observer.player_changed(name, old, new)
+
+    def intern(self, achievement: str) -> int:
+        """
+        Returns the bit position of an achievement, assigning a new one on
+        first sight.
+        """
+        bit = self.bits.get(achievement)
+        if bit is None:
+            bit = self.bits[achievement] = len(self.names)
+            self.names.append(achievement)
+            self.counts.append(0)
+            self.by_count.setdefault(0, set()).add(bit)
+        return bit
+
+    def encode(self, achievements: Iterable[str]) -> int:
+        """
+        Bitmask of a collection of achievements.
+        """
+        mask = 0
+        for achievement in achievements:
+            mask |= 1 << self.intern(achievement)
+        return mask
+
+    def decode(self, mask: int) -> Set[str]:
+        """
+        Achievement names of a bitmask.
+        """
+        names = set()
+        while mask:
+            low = mask & -mask
+            names.add(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+    def _count(self, mask: int, step: int) -> None:
+        while mask:
+            low = mask & -mask
+            bit = low.bit_length() - 1
+            count = self.counts[bit]
+            bucket = self.by_count[count]
+            bucket.discard(bit)
+            if not bucket:
+                del self.by_count[count]
+            self.counts[bit] = count + step
+            self.by_count.setdefault(count + step, set()).add(bit)
+            mask ^= low
+
+    def set_player(self, name: str, achievements: Iterable[str]) -> int:
+        """
+        Set the whole achievement list of a player; duplicates collapse.
+        """
+        mask = self.encode(achievements)
+        old = self.players.get(name, 0)
+        self._count(old & ~mask, -1)
+        self._count(mask & ~old, 1)
+        self.players[name] = mask
+        self._changed(name, old, mask)
+        return mask
+
+    def grant(self, name: str, achievement: str) -> None:
+        """
+        Give one achievement to a player.
+        """
+        bit = 1 << self.intern(achievement)
+        mask = self.players.get(name, 0)
+        if not mask & bit:
+            self.players[name] = mask | bit
+            self._count(bit, 1)
+            self._changed(name, mask, mask | bit)
+
+    def revoke(self, name: str, achievement: str) -> None:
+        """
+        Take one achievement away from a player.
+        """
+        bit = 1 << self.bits[achievement]
+        mask = self.players[name]
+        if mask & bit:
+            self.players[name] = mask ^ bit
+            self._count(bit, -1)
+            self._changed(name, mask, mask ^ bit)
+
+    def union(self) -> int:
+        """
+        Mask of the achievements held by at least one player.
+        """
+        return ((1 << len(self.names)) - 1) & ~self.held_by(0)
+
+    def intersection(self) -> int:
+        """
+        Mask of the achievements held by every player.
+        """
+        if not self.players:
+            return 0
+        return self.held_by(len(self.players))
+
+    def held_by(self, count: int) -> int:
+        """
+        Mask of the achievements held by exactly count players, read from
+        the frequency index.
+        """
+        mask = 0
+        for bit in self.by_count.get(count, ()):
+            mask |= 1 << bit
+        return mask
+
+    def rarity(self) -> Dict[str, int]:
+        """
+        Number of holders of every achievement.
+        """
+        return dict(zip(self.names, self.counts))
+
+    def compare(self, a: str, b: str) -> Tuple[int, int, int]:
+        """
+        (common, only a, only b) masks of two players.
+        """
+        mask_a = self.players[a]
+        mask_b = self.players[b]
+        return mask_a & mask_b, mask_a & ~mask_b, mask_b & ~mask_a
+
+    def jaccard(self, a: str, b: str) -> float:
+        """
+        Exact Jaccard similarity of two players' achievements.
+        """
+        mask_a = self.players[a]
+        mask_b = self.players[b]
+        union = popcount(mask_a | mask_b)
+        return popcount(mask_a & mask_b) / union if union else 1.0
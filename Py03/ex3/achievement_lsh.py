@@ -0,0 +1,122 @@
+from random import Random
+from typing import Dict, List, Optional, Set, Tuple
+
+from achievement_bits import AchievementIndex, popcount
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+class SimilarityIndex:
+    """
+    MinHash / LSH index answering "players most like X" over an
+    AchievementIndex.
+
+    Each player gets a MinHash signature of num_perm values, cut into
+    bands; players sharing a band land in the same bucket and become
+    candidates, which are then ranked by their exact Jaccard similarity
+    on the bitmasks. The index subscribes to the AchievementIndex, so
+    signatures and buckets follow every change.
+
+    The default 32 bands of 2 rows make a pair at Jaccard 0.5 a
+    candidate with probability 1 - (1 - 0.5 ** 2) ** 32, above 0.9999.
+    Indexes of at most exact_scan_limit players (none by default) are
+    ranked by an exact scan instead.
+    """
+
+    def __init__(self, index: AchievementIndex, num_perm: int = 64,
+                 bands: int = 32, seed: int = 42,
+                 exact_scan_limit: int = 0) -> None:
+        """
+        Initialize the hash family and index every known player.
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.index = index
+        self.exact_scan_limit = exact_scan_limit
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = Random(seed)
+        self.hashes = [(rng.randrange(1, MERSENNE_PRIME),
+                        rng.randrange(MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+        self.bit_hashes: List[Tuple[int, ...]] = []
+        self.signatures: Dict[str, Tuple[int, ...]] = {}
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+        for name, mask in index.players.items():
+            self.player_changed(name, 0, mask)
+        index.subscribe(self)
+
+    def _bit_hash(self, bit: int) -> Tuple[int, ...]:
+        while len(self.bit_hashes) <= bit:
+            x = len(self.bit_hashes)
+            self.bit_hashes.append(tuple((a * x + b) % MERSENNE_PRIME
+                                         for a, b in self.hashes))
+        return self.bit_hashes[bit]
+
+    def signature(self, mask: int) -> Optional[Tuple[int, ...]]:
+        """
+        MinHash signature of a bitmask, None for an empty one.
+        """
+        vectors = []
+        while mask:
+            low = mask & -mask
+            vectors.append(self._bit_hash(low.bit_length() - 1))
+            mask ^= low
+        if not vectors:
+            return None
+        return tuple(map(min, zip(*vectors)))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[tuple]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows])
+                for band in range(self.bands)]
+
+    def player_changed(self, name: str, old: int, new: int) -> None:
+        """
+        Observer hook: move a player to the buckets of its new signature.
+        """
+        previous = self.signatures.pop(name, None)
+        if previous is not None:
+            for key in self._band_keys(previous):
+                bucket = self.buckets[key]
+                bucket.discard(name)
+                if not bucket:
+                    del self.buckets[key]
+        signature = self.signature(new)
+        if signature is not None:
+            self.signatures[name] = signature
+            for key in self._band_keys(signature):
+                self.buckets.setdefault(key, set()).add(name)
+
+    def candidates(self, name: str) -> Set[str]:
+        """
+        Players sharing at least one LSH band with name.
+        """
+        signature = self.signatures.get(name)
+        if signature is None:
+            return set()
+        found = set()
+        for key in self._band_keys(signature):
+            found |= self.buckets[key]
+        found.discard(name)
+        return found
+
+    def most_similar(self, name: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Up to k (player, Jaccard similarity) pairs most like name, best
+        first, among the LSH candidates, or among every player when the
+        index is within exact_scan_limit. Fewer than k pairs come back
+        when name has fewer candidates.
+        """
+        mask = self.index.players[name]
+        if len(self.index.players) <= self.exact_scan_limit:
+            others = [other for other in self.index.players
+                      if other != name and self.index.players[other]]
+        else:
+            others = self.candidates(name)
+        scored = []
+        for other in others:
+            other_mask = self.index.players[other]
+            union = popcount(mask | other_mask)
+            scored.append((popcount(mask & other_mask) / union, other))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [(other, score) for score, other in scored[:k]]
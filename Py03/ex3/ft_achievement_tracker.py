@@ -1,3 +1,6 @@
+from achievement_bits import AchievementIndex
+from achievement_lsh import SimilarityIndex
+
 data = {
     'alice': ['first_blood', 'pixel_perfect', 'speed_runner',
               'first_blood', 'first_blood'],
@@ -22,23 +25,14 @@ if __name__ == "__main__":
     print("=== Achievement Tracker System ===")
     print()
 
-    unique_achievements = set()
-    common_to_all_players = set(data['alice'])
-
-    achievement_counts = {}
-
+    index = AchievementIndex()
     for player_name, achievements in data.items():
-        player_set = set(achievements)
-        print(f"Player {player_name} achievements: {player_set}")
+        index.set_player(player_name, achievements)
+        print(f"Player {player_name} achievements: "
+              f"{index.decode(index.players[player_name])}")
 
-        unique_achievements = unique_achievements.union(player_set)
-        common_to_all_players = common_to_all_players.intersection(player_set)
-
-        for achievement in player_set:
-            if achievement in achievement_counts:
-                achievement_counts[achievement] += 1
-            else:
-                achievement_counts[achievement] = 1
+    unique_achievements = index.decode(index.union())
+    common_to_all_players = index.decode(index.intersection())
 
     print()
     print("=== Achievement Analytics ===")
@@ -46,13 +40,17 @@ if __name__ == "__main__":
     print(f"Total unique achievements: {len(unique_achievements)}\n")
     print(f"Common to all players: {common_to_all_players}")
 
-    rare_achievements = {a for a, count in achievement_counts.items()
-                         if count == 1}
+    rare_achievements = index.decode(index.held_by(1))
     print(f"Rare achievements (1 player): {rare_achievements}")
 
     print()
-    alice = set(data['alice'])
-    bob = set(data['bob'])
-    print(f"Alice vs Bob common: {set(alice.intersection(bob))}")
-    print(f"Alice unique: {set(alice.difference(bob))}")
-    print(f"Alice unique: {set(bob.difference(alice))}")
+    common, alice, bob = index.compare('alice', 'bob')
+    print(f"Alice vs Bob common: {index.decode(common)}")
+    print(f"Alice unique: {index.decode(alice)}")
+    print(f"Bob unique: {index.decode(bob)}")
+
+    print()
+    similar = SimilarityIndex(index)
+    print("Players most like charlie: " + ", ".join(
+        f"{name} ({score:.2f})"
+        for name, score in similar.most_similar('charlie', 3)))
@@ -1,3 +1,7 @@
+from inventory_engine import (InventoryEngine, Transfer, TransferEngine,
+                              TransferError)
+from inventory_analytics import InventoryAnalytics
+
 game_data = {
     "players": {
         "alice": {
@@ -68,76 +72,75 @@ game_data = {
 }
 
 
-def alice_inventory(player, catalog, inventory_value, item_count):
+def alice_inventory(player, catalog, inventory_value, item_count,
+                    categories):
     """
     Prints a detailed inventory report for a given player (Alice).
+
+    Each held item is looked up directly in the catalog instead of
+    joining both key sets.
     """
-    for value in player.keys():
-        for val in catalog.keys():
-            if value == val:
-                quantity = player[value]
-                item_value = catalog[val].get("value")
-                total_price = quantity * item_value
-
-                print(f"{val} ({catalog[val].get('type')},"
-                      f"{catalog[val].get('rarity')}): ", end="")
-                print(
-                    f"{quantity}x @ {item_value} gold each = "
-                    f"{total_price} gold"
-                    )
+    for val, quantity in player.items():
+        item_value = catalog[val].get("value")
+        total_price = quantity * item_value
+
+        print(f"{val} ({catalog[val].get('type')},"
+              f"{catalog[val].get('rarity')}): ", end="")
+        print(
+            f"{quantity}x @ {item_value} gold each = "
+            f"{total_price} gold"
+            )
     print()
     print(f"Inventory value: {inventory_value} gold")
     print(f"Item count: {item_count} items")
-    print("Categories: weapon(2), consumable(1), accessory(1)\n")
+    print("Categories: " + ", ".join(f"{category}({count})"
+                                     for category, count
+                                     in categories.items()) + "\n")
 
 
-def inventory_analytics():
+def inventory_analytics(analytics):
     """
-    Analyzes all players' inventories to find top performers.'
+    Analyzes all players' inventories to find top performers.
+
+    Every figure is read from the incrementally maintained
+    InventoryAnalytics indexes.
     """
     print("=== Inventory Analytics ===")
 
-    max_item = 0
-    max_value = 0
-    player_max_item = ""
-    player_max_value = ""
-
-    for name, values in game_data["players"].items():
-        if values['item_count'] > max_item:
-            max_item = values['item_count']
-            player_max_item = name
-        if values['total_value'] > max_value:
-            max_value = values['total_value']
-            player_max_value = name
+    player_max_value, max_value = analytics.most_valuable()
+    player_max_item, max_item = analytics.most_items()
 
     print(f"Most valuable player: {player_max_value} ({max_value} gold)")
     print(f"Most items: {player_max_item} ({max_item} items)")
+    print(f"Median inventory value: {analytics.value_percentile(50)} gold")
+    print(f"Rarity distribution: {analytics.rarity_distribution()}")
+    print(f"Rarest items: {', '.join(analytics.rarest_items())}")
 
 
 if __name__ == "__main__":
     print("=== Player Inventory System ===\n")
 
     print("=== Alice's Inventory ===")
-    player = game_data["players"]['alice']['items']
+    engine = InventoryEngine(game_data["catalog"], game_data["players"])
+    analytics = InventoryAnalytics(engine)
+    player = engine.items['alice']
     catalog = game_data["catalog"]
-    inventory_value = game_data["players"]['alice']['total_value']
-    item_count = game_data["players"]['alice']['item_count']
+    inventory_value = engine.value('alice')
+    item_count = engine.item_count('alice')
 
-    alice_inventory(player, catalog, inventory_value, item_count)
+    alice_inventory(player, catalog, inventory_value, item_count,
+                    analytics.categories('alice'))
 
     print("=== Transaction: Alice gives Bob 2 quantum_ring ===")
-    if (player['quantum_ring'] - 2) > 0:
+    try:
+        TransferEngine(engine).apply(
+            [Transfer("alice", "bob", "quantum_ring", 2)])
+    except TransferError as e:
+        print(f"Transaction failed: {e}\n")
+    else:
         print("Transaction successful!\n")
         print("=== Updated Inventories ===")
-        print(f"Alice potions: {player['quantum_ring'] - 2}")
-        print(f"Bob potions: {player['quantum_ring'] - 1}\n")
-    else:
-        print("Transaction failed: not enough items\n")
-
-    inventory_analytics()
-    rerest = ()
-    for key, val in game_data["players"].items():
-        for x in val['items']:
-            rerest = x
+        print(f"Alice potions: {engine.quantity('alice', 'quantum_ring')}")
+        print(f"Bob potions: {engine.quantity('bob', 'quantum_ring')}\n")
 
-    print(f"Rarest items: {rerest}")
+    inventory_analytics(analytics)
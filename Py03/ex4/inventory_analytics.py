@@ -0,0 +1,131 @@
+from bisect import bisect_left, insort
+from math import ceil
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from inventory_engine import InventoryEngine
+
+
+class InventoryAnalytics:
+    """
+    Group-by indexes over an InventoryEngine, patched on every change.
+
+    - units_by_type / units_by_rarity: items held, summed per catalog
+      type and rarity
+    - kinds_by_player: per player, distinct items held per type
+    - sorted_values / sorted_counts: (value, player) and (count, player)
+      pairs kept sorted for top players and percentiles
+    """
+
+    def __init__(self, engine: InventoryEngine) -> None:
+        """
+        Build every index from the current engine state and subscribe to
+        its changes.
+        """
+        self.engine = engine
+        self.catalog = engine.catalog
+        self.lock = Lock()
+        self.units_by_type: Dict[str, int] = {}
+        self.units_by_rarity: Dict[str, int] = {}
+        self.kinds_by_player: Dict[str, Dict[str, int]] = {}
+        self.player_values: Dict[str, int] = {}
+        self.player_counts: Dict[str, int] = {}
+        self.sorted_values: List[Tuple[int, str]] = []
+        self.sorted_counts: List[Tuple[int, str]] = []
+
+        for name, items in engine.items.items():
+            for item, quantity in items.items():
+                self._account(name, item, 0, quantity)
+            self.player_values[name] = engine.value(name)
+            self.player_counts[name] = engine.item_count(name)
+        self.sorted_values = sorted(
+            (value, name) for name, value in self.player_values.items())
+        self.sorted_counts = sorted(
+            (count, name) for name, count in self.player_counts.items())
+        engine.subscribe(self)
+
+    def _account(self, name: str, item: str, before: int,
+                 after: int) -> None:
+        entry = self.catalog[item]
+        delta = after - before
+        self.units_by_type[entry["type"]] = (
+            self.units_by_type.get(entry["type"], 0) + delta)
+        self.units_by_rarity[entry["rarity"]] = (
+            self.units_by_rarity.get(entry["rarity"], 0) + delta)
+        kinds = self.kinds_by_player.setdefault(name, {})
+        if before == 0 and after > 0:
+            kinds[entry["type"]] = kinds.get(entry["type"], 0) + 1
+        elif before > 0 and after == 0:
+            kinds[entry["type"]] -= 1
+            if not kinds[entry["type"]]:
+                del kinds[entry["type"]]
+
+    @staticmethod
+    def _move(pairs: List[Tuple[int, str]], name: str, old: int,
+              new: int) -> None:
+        if old is not None:
+            del pairs[bisect_left(pairs, (old, name))]
+        insort(pairs, (new, name))
+
+    def item_changed(self, name: str, item: str, before: int,
+                     after: int) -> None:
+        """
+        Observer hook called by the engine after a quantity change.
+        """
+        with self.lock:
+            self._account(name, item, before, after)
+            value = self.engine.value(name)
+            count = self.engine.item_count(name)
+            self._move(self.sorted_values, name,
+                       self.player_values.get(name), value)
+            self._move(self.sorted_counts, name,
+                       self.player_counts.get(name), count)
+            self.player_values[name] = value
+            self.player_counts[name] = count
+
+    def categories(self, name: str) -> Dict[str, int]:
+        """
+        Distinct items held by a player, per catalog type.
+        """
+        return dict(self.kinds_by_player.get(name, {}))
+
+    def rarity_distribution(self) -> Dict[str, int]:
+        """
+        Items held across every player, per rarity.
+        """
+        return {rarity: units
+                for rarity, units in self.units_by_rarity.items() if units}
+
+    def rarest_items(self) -> List[str]:
+        """
+        Held items with the fewest holders.
+        """
+        holders = {item: len(self.engine.holders_of(item))
+                   for item in self.catalog}
+        held = [count for count in holders.values() if count]
+        if not held:
+            return []
+        fewest = min(held)
+        return [item for item, count in holders.items() if count == fewest]
+
+    def most_valuable(self) -> Tuple[str, int]:
+        """
+        The (player, value) pair with the most valuable inventory.
+        """
+        value, name = self.sorted_values[-1]
+        return name, value
+
+    def most_items(self) -> Tuple[str, int]:
+        """
+        The (player, item count) pair holding the most items.
+        """
+        count, name = self.sorted_counts[-1]
+        return name, count
+
+    def value_percentile(self, percentile: float) -> int:
+        """
+        Inventory value at a percentile of the players, nearest-rank.
+        """
+        n = len(self.sorted_values)
+        rank = min(max(ceil(percentile * n / 100), 1), n)
+        return self.sorted_values[rank - 1][0]
@@ -0,0 +1,245 @@
+from threading import Lock
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class InventoryError(Exception):
+    """
+    A basic error for inventory problems.
+    """
+    pass
+
+
+class UnknownItemError(InventoryError):
+    """
+    For items missing from the catalog (inherits from InventoryError).
+    """
+    pass
+
+
+class InsufficientItemsError(InventoryError):
+    """
+    For removing more items than a player holds (inherits from
+    InventoryError).
+    """
+    pass
+
+
+class InventoryEngine:
+    """
+    Player inventories kept in sync with an item -> holders inverted index
+    and per-player cached valuations.
+
+    Every add or remove patches the inverted index, the item count and
+    the gold value of the player, so valuation and "who holds X" queries
+    never rescan the items.
+    """
+
+    def __init__(self, catalog: Dict[str, Dict[str, Any]],
+                 players: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Initialize the engine, loading the items of a players table.
+        """
+        self.catalog = catalog
+        self.items: Dict[str, Dict[str, int]] = {}
+        self.holders: Dict[str, Dict[str, int]] = {}
+        self.values: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self.observers: List[Any] = []
+        for name, player in (players or {}).items():
+            self.add_player(name)
+            for item, quantity in player["items"].items():
+                self.add_item(name, item, quantity)
+
+    def subscribe(self, observer: Any) -> None:
+        """
+        Register an observer whose item_changed(name, item, before, after)
+        is called after every quantity change.
+        """
+        self.observers.append(observer)
+
+    def add_player(self, name: str) -> None:
+        """
+        Register a player with an empty inventory.
+        """
+        if name not in self.items:
+            self.items[name] = {}
+            self.values[name] = 0
+            self.counts[name] = 0
+
+    def price(self, item: str) -> int:
+        """
+        Catalog value of one item.
+        """
+        try:
+            return self.catalog[item]["value"]
+        except KeyError:
+            raise UnknownItemError(f"Unknown item: {item}") from None
+
+    def add_item(self, name: str, item: str, quantity: int = 1) -> None:
+        """
+        Give quantity items to a player.
+        """
+        if quantity <= 0:
+            raise InventoryError(f"Invalid quantity: {quantity}")
+        price = self.price(item)
+        self.add_player(name)
+        items = self.items[name]
+        held = items.get(item, 0)
+        items[item] = held + quantity
+        self.holders.setdefault(item, {})[name] = items[item]
+        self.values[name] += price * quantity
+        self.counts[name] += quantity
+        for observer in self.observers:
+            observer.item_changed(name, item, held, held + quantity)
+
+    def remove_item(self, name: str, item: str, quantity: int = 1) -> None:
+        """
+        Take quantity items from a player.
+        """
+        if quantity <= 0:
+            raise InventoryError(f"Invalid quantity: {quantity}")
+        price = self.price(item)
+        held = self.items.get(name, {}).get(item, 0)
+        if held < quantity:
+            raise InsufficientItemsError(
+                f"{name} holds {held} {item}, cannot remove {quantity}")
+        items = self.items[name]
+        if held == quantity:
+            del items[item]
+            del self.holders[item][name]
+        else:
+            items[item] = held - quantity
+            self.holders[item][name] = held - quantity
+        self.values[name] -= price * quantity
+        self.counts[name] -= quantity
+        for observer in self.observers:
+            observer.item_changed(name, item, held, held - quantity)
+
+    def quantity(self, name: str, item: str) -> int:
+        """
+        How many of an item a player holds.
+        """
+        return self.items.get(name, {}).get(item, 0)
+
+    def value(self, name: str) -> int:
+        """
+        Total gold value of a player's inventory, in O(1).
+        """
+        return self.values[name]
+
+    def item_count(self, name: str) -> int:
+        """
+        Total number of items held by a player, in O(1).
+        """
+        return self.counts[name]
+
+    def holders_of(self, item: str) -> Dict[str, int]:
+        """
+        Players holding an item mapped to their quantity.
+        """
+        return self.holders.get(item, {})
+
+
+class TransferError(InventoryError):
+    """
+    For a rejected transfer batch (inherits from InventoryError).
+    """
+
+    def __init__(self, message: str, index: int) -> None:
+        super().__init__(message)
+        self.index = index
+
+
+class TransferConflictError(TransferError):
+    """
+    For transfers of a batch drawing on the same items beyond what the
+    sender holds (inherits from TransferError).
+    """
+    pass
+
+
+class Transfer(NamedTuple):
+    """
+    Move quantity items from sender to receiver.
+    """
+    sender: str
+    receiver: str
+    item: str
+    quantity: int
+
+
+class TransferEngine:
+    """
+    Applies batches of transfers atomically on an InventoryEngine.
+
+    A batch is validated in order against the holdings, then applied as
+    net per-player deltas: either every transfer applies or none does.
+    Players are spread over striped locks, so batches touching different
+    players run concurrently; the stripes of a batch are taken in index
+    order to avoid deadlocks.
+    """
+
+    def __init__(self, engine: InventoryEngine, stripes: int = 64) -> None:
+        """
+        Initialize the transfer engine with its lock stripes.
+        """
+        self.engine = engine
+        self.locks = [Lock() for _ in range(stripes)]
+
+    def _stripes(self, transfers: List[Transfer]) -> List[int]:
+        stripes = set()
+        for transfer in transfers:
+            stripes.add(hash(transfer.sender) % len(self.locks))
+            stripes.add(hash(transfer.receiver) % len(self.locks))
+        return sorted(stripes)
+
+    def _plan(self, transfers: List[Transfer]) -> Dict[Tuple[str, str], int]:
+        """
+        Validate a batch and return its net (player, item) -> delta.
+        """
+        deltas: Dict[Tuple[str, str], int] = {}
+        for i, (sender, receiver, item, quantity) in enumerate(transfers):
+            if quantity <= 0:
+                raise TransferError(f"Invalid quantity: {quantity}", i)
+            if sender == receiver:
+                raise TransferError(f"{sender} cannot give to itself", i)
+            if item not in self.engine.catalog:
+                raise TransferError(f"Unknown item: {item}", i)
+            key = (sender, item)
+            held = self.engine.quantity(sender, item)
+            delta = deltas.get(key, 0)
+            if held + delta < quantity:
+                if delta < 0:
+                    raise TransferConflictError(
+                        f"{sender} gives {quantity} {item} with only "
+                        f"{held + delta} left by earlier transfers", i)
+                raise TransferError(
+                    f"{sender} holds {held + delta} {item}, "
+                    f"cannot give {quantity}", i)
+            deltas[key] = delta - quantity
+            gain = (receiver, item)
+            deltas[gain] = deltas.get(gain, 0) + quantity
+        return deltas
+
+    def apply(self, transfers: Iterable[Transfer]) -> int:
+        """
+        Apply a whole batch or raise a TransferError and change nothing.
+
+        Returns:
+            int: The number of transfers applied
+        """
+        transfers = [Transfer(*transfer) for transfer in transfers]
+        locks = [self.locks[i] for i in self._stripes(transfers)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            deltas = self._plan(transfers)
+            for (name, item), delta in deltas.items():
+                if delta > 0:
+                    self.engine.add_item(name, item, delta)
+                elif delta < 0:
+                    self.engine.remove_item(name, item, -delta)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        return len(transfers)
@@ -0,0 +1,88 @@
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Union
+
+from time_index import parse_timestamp
+
+
+class EventRecord:
+    """
+    Compact game event, replacing the dict with its nested data dict.
+
+    Fields live in __slots__, repeated strings (player, event type, zone)
+    are interned and the timestamp is kept as epoch seconds.
+    """
+
+    __slots__ = ("id", "player", "event_type", "ts", "level",
+                 "score_delta", "zone")
+
+    def __init__(self, id: int, player: str, event_type: str, ts: int,
+                 level: int, score_delta: int, zone: str) -> None:
+        """
+        Initialize a record from its flat fields.
+        """
+        self.id = id
+        self.player = sys.intern(player)
+        self.event_type = sys.intern(event_type)
+        self.ts = ts
+        self.level = level
+        self.score_delta = score_delta
+        self.zone = sys.intern(zone)
+
+    @classmethod
+    def from_dict(cls, event: Dict[str, Any]) -> "EventRecord":
+        """
+        Build a record from the dict form used by the events list.
+        """
+        data = event["data"]
+        return cls(event["id"], event["player"], event["event_type"],
+                   parse_timestamp(event["timestamp"]), data["level"],
+                   data["score_delta"], data["zone"])
+
+    @property
+    def timestamp(self) -> str:
+        """
+        ISO form of the timestamp, as found in the dict events.
+        """
+        return (datetime.fromtimestamp(self.ts, timezone.utc)
+                .strftime("%Y-%m-%dT%H:%M"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record back to the dict form.
+        """
+        return {
+            "id": self.id,
+            "player": self.player,
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "data": {"level": self.level, "score_delta": self.score_delta,
+                     "zone": self.zone},
+        }
+
+    def __repr__(self) -> str:
+        return (f"EventRecord({self.id}, {self.player!r}, "
+                f"{self.event_type!r}, {self.timestamp!r}, {self.level}, "
+                f"{self.score_delta}, {self.zone!r})")
+
+
+def to_record(event: Union[EventRecord, Dict[str, Any]]) -> EventRecord:
+    """
+    Returns event as an EventRecord, converting it when it is a dict.
+    """
+    if isinstance(event, EventRecord):
+        return event
+    return EventRecord.from_dict(event)
+
+
+def to_records(
+    events: Iterable[Union[EventRecord, Dict[str, Any]]]
+) -> Iterator[EventRecord]:
+    """
+    Generator converting a stream of events to EventRecords.
+
+    Yields:
+        EventRecord: The next event of the stream
+    """
+    for event in events:
+        yield to_record(event)
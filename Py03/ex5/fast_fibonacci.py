@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Iterator, Tuple
+
+CACHE_SIZE = 1024
+
+
+def _fib_pair(n: int) -> Tuple[int, int]:
+    """
+    Returns (F(n), F(n + 1)) by fast doubling.
+
+    Walks the bits of n from the most significant one, using
+        F(2k) = F(k) * (2 * F(k + 1) - F(k))
+        F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+    so only O(log n) big-int multiplications are needed.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fib_pair(n: int) -> Tuple[int, int]:
+    """
+    Cached (F(n), F(n + 1)), kept bounded to the CACHE_SIZE hot indexes.
+    """
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    return _fib_pair(n)
+
+
+def fib(n: int) -> int:
+    """
+    Returns the n-th Fibonacci number, fib(0) being 0.
+    """
+    return fib_pair(n)[0]
+
+
+def fib_range(start: int, stop: int) -> Iterator[int]:
+    """
+    Generator of F(start), ..., F(stop - 1).
+
+    Jumps straight to start with fast doubling, then iterates.
+
+    Yields:
+        int: The next Fibonacci number in the range
+    """
+    if start >= stop:
+        return
+    a, b = fib_pair(start)
+    for _ in range(stop - start):
+        yield a
+        a, b = b, a + b
@@ -1,3 +1,14 @@
+import sys
+import json
+import time
+from itertools import chain
+
+from event_record import EventRecord
+from fast_fibonacci import fib
+from prime_sieve import iter_primes
+from sessionizer import Sessionizer
+from time_index import DAY, TimeRollup, parse_timestamp
+
 events = [
     {
         "id": 1,
@@ -352,40 +363,134 @@ events = [
 ]
 
 
-def stream_analytics():
+def read_events(path):
+    """
+    Generator reading game events from an NDJSON file.
+
+    Each non-empty line holds one JSON event. Lines are parsed one at a
+    time so the file is never loaded into memory as a whole.
+
+    Yields:
+        dict: The next event of the file
+    """
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def analyze_stream(stream):
+    """
+    Computes the stream analytics in a single pass over any iterable.
+
+    Events may be dicts or EventRecords; the fields needed are read
+    straight from either form, so dicts are never converted (nor their
+    timestamps parsed). Only the counters and the per-player /
+    per-zone aggregates are kept, so memory grows with the number of
+    distinct players and zones and not with the number of events.
+
+    Returns:
+        dict: processed, high_level, treasure, level_up, players, zones
+    """
+    processed = 0
+    hight_lvl = 0
+    Treasure_events = 0
+    Level_up = 0
+    players = {}
+    zones = {}
+
+    for event in stream:
+        processed += 1
+        if isinstance(event, EventRecord):
+            name, event_type = event.player, event.event_type
+            level, delta, zone_name = (event.level, event.score_delta,
+                                       event.zone)
+        else:
+            name, event_type = event["player"], event["event_type"]
+            data = event["data"]
+            level, delta, zone_name = (data["level"], data["score_delta"],
+                                       data["zone"])
+        if event_type == "Treasure":
+            Treasure_events += 1
+        elif event_type == "level_up":
+            Level_up += 1
+        if level > 10:
+            hight_lvl += 1
+
+        player = players.get(name)
+        if player is None:
+            player = players[name] = {"events": 0, "score": 0,
+                                      "max_level": 0}
+        player["events"] += 1
+        player["score"] += delta
+        if level > player["max_level"]:
+            player["max_level"] = level
+
+        zone = zones.get(zone_name)
+        if zone is None:
+            zone = zones[zone_name] = {"events": 0, "score": 0}
+        zone["events"] += 1
+        zone["score"] += delta
+
+    return {
+        "processed": processed,
+        "high_level": hight_lvl,
+        "treasure": Treasure_events,
+        "level_up": Level_up,
+        "players": players,
+        "zones": zones,
+    }
+
+
+def tap(stream, rollup, sessionizer, sessions):
+    """
+    Generator passing a stream through unchanged while feeding every
+    event to a TimeRollup and a Sessionizer, so the time window and the
+    sessions come from the same single pass as the analytics. Closed
+    sessions are appended to sessions.
+
+    Yields:
+        dict: The next event of the stream
+    """
+    for event in stream:
+        rollup.add(event)
+        sessions.extend(sessionizer.feed(event))
+        yield event
+
+
+def stream_analytics(stream=None):
     """
     Analyzes the event stream for key metrics.
 
     - High-level players: counts events where player level > 10
     - Treasure events: counts events with event_type "Treasure"
     - Level-up events: counts events with event_type "level_up"
+
+    The stream can be any iterable of events (a list, a generator or
+    read_events() over an NDJSON file), of dicts or EventRecords; it
+    defaults to the in-memory events list.
     """
+    if stream is None:
+        stream = events
+    stats = analyze_stream(stream)
 
-    print("Total events processed: 1000")
-    i = 0
-    hight_lvl = 0
-    Treasure_events = 0
-    Level_up = 0
-    while i < len(events):
-        for key, value in events[i].items():
-            if key == "event_type" and value == "Treasure":
-                Treasure_events += 1
-            if key == "event_type" and value == "level_up":
-                Level_up += 1
-            if key == "data":
-                for x, y in value.items():
-                    if x == "level" and y > 10:
-                        hight_lvl += 1
-        i += 1
-    print(f"High-level players (10+): {hight_lvl}")
-    print(f"Treasure events: {Treasure_events}")
-    print(f"Level-up events: {Level_up}\n")
+    print(f"Total events processed: {stats['processed']}")
+    print(f"High-level players (10+): {stats['high_level']}")
+    print(f"Treasure events: {stats['treasure']}")
+    print(f"Level-up events: {stats['level_up']}")
+    print(f"Players seen: {len(stats['players'])}, "
+          f"zones seen: {len(stats['zones'])}\n")
+    return stats
 
 
 def fibonacci(index):
     """
     Generator function for the Fibonacci sequence.
 
+    For random access to a single term use fast_fibonacci.fib instead of
+    walking the whole sequence.
+
     Yields:
         int: The next Fibonacci number in the sequence
     """
@@ -402,55 +507,77 @@ def fibonacci(index):
 def prime_numbers():
     """
     Infinite prime numbers generator.
+
+    Delegates to the segmented sieve of prime_sieve instead of testing
+    every integer by trial division.
      Yields:
         int: The next prime number in ascending order
     """
-    num = 2
-    while True:
-        is_prime = True
-        if num < 2:
-            is_prime = False
-        for i in range(2, int(num ** 0.5) + 1):
-            if num % i == 0:
-                is_prime = False
-                break
-
-        if is_prime:
-            yield num
-        num += 1
+    yield from iter_primes()
 
 
 if __name__ == "__main__":
     print("=== Game Data Stream Processor ===\n")
 
-    print("Processing 1000 game events...")
+    if len(sys.argv) > 1:
+        source = read_events(sys.argv[1])
+        print(f"Processing game events from {sys.argv[1]}...")
+    else:
+        source = iter(sorted(events,
+                             key=lambda e: parse_timestamp(e["timestamp"])))
+        print(f"Processing {len(events)} game events...")
+    rollup = TimeRollup(DAY)
+    sessionizer = Sessionizer(timeout=DAY)
+    sessions = []
+    stream = tap(source, rollup, sessionizer, sessions)
 
-    i = 0
-    player = ""
-    event = ""
-    lvl = ""
-    while i < 3:
-        for key, value in events[i].items():
-            if key == "player":
-                player = value
-
-            if key == "event_type":
-                event = value
-
-            if key == "data":
-                for x, y in value.items():
-                    if x == "level":
-                        lvl = y
-
-        print(f"Event {i+1}: Player {player} (level {lvl}) {event}")
-        i += 1
-    print("...\n")
+    try:
+        head = []
+        for event in stream:
+            head.append(event)
+            print(f"Event {len(head)}: Player {event['player']} "
+                  f"(level {event['data']['level']}) {event['event_type']}")
+            if len(head) == 3:
+                break
+        print("...\n")
+
+        print("=== Stream Analytics ===")
 
-    print("=== Stream Analytics ===")
+        start = time.perf_counter()
+        stats = stream_analytics(chain(head, stream))
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"Event stream could not be read: {e}")
+        sys.exit(1)
+    print(f"Memory usage: {len(stats['players'])} player and "
+          f"{len(stats['zones'])} zone aggregates (not per event)\n"
+          f"Processing time: {elapsed:.3f} seconds")
+
+    print()
 
-    stream_analytics()
-    print("Memory usage: Constant (streaming)\nProcessing time: 0.045 seconds")
+    print("=== Time Window ===")
+    days = rollup.rollup()
+    if days:
+        first = min(rollup.buckets)
+        week = sum(count for key, (count, _) in rollup.buckets.items()
+                   if key < first + 7 * DAY)
+        busiest = max(days, key=lambda day: day[1])
+        print(f"Events in first week: {week}")
+        print(f"Busiest day: {busiest[0][:10]} ({busiest[1]} events, "
+              f"{busiest[2]} score)\n")
+    else:
+        print("No events in the stream\n")
 
+    print("=== Sessions ===")
+    sessions.extend(sessionizer.flush())
+    print(f"Sessions found: {len(sessions)}")
+    if sessions:
+        longest = max(sessions, key=lambda session: session.duration)
+        print(f"Longest session: {longest.player} "
+              f"({longest.duration // 60} minutes, {longest.events} "
+              f"events, {longest.score_delta} score)")
+    if sessionizer.late:
+        print(f"Late events dropped: {sessionizer.late}")
     print()
 
     print("=== Generator Demonstration ===")
@@ -463,6 +590,7 @@ if __name__ == "__main__":
         count += 1
 
     print()
+    print(f"Fibonacci F(100): {fib(100)}")
 
     print("Prime numbers (first 5):", end=" ")
     count = 0
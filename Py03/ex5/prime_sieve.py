@@ -0,0 +1,127 @@
+from itertools import compress, count
+from math import isqrt, log
+from typing import Iterator, List
+
+SEGMENT_SIZE = 1 << 18
+
+
+def _base_primes(limit: int) -> List[int]:
+    """
+    Returns the odd primes <= limit with a plain odd-only sieve.
+    """
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2
+    sieve = bytearray(b"\x01") * size
+    for i in range((isqrt(limit) - 1) // 2):
+        if sieve[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            sieve[start::p] = bytes(len(range(start, size, p)))
+    return list(compress(range(3, limit + 1, 2), sieve))
+
+
+def _sieve_segment(low: int, high: int, primes: List[int]) -> bytearray:
+    """
+    Sieves the odd numbers of [low, high) where low is odd.
+
+    Index i of the returned bytearray stands for low + 2 * i and is 1 when
+    that number is prime. primes must hold every odd prime <= sqrt(high).
+    """
+    size = (high - low + 1) // 2
+    segment = bytearray(b"\x01") * size
+    for p in primes:
+        square = p * p
+        if square >= high:
+            break
+        if square >= low:
+            start = square
+        else:
+            start = (low + p - 1) // p * p
+            if not start & 1:
+                start += p
+        index = (start - low) // 2
+        if index < size:
+            segment[index::p] = bytes((size - 1 - index) // p + 1)
+    if low == 1:
+        segment[0] = 0
+    return segment
+
+
+def _segments(limit: int = None) -> Iterator[tuple]:
+    """
+    Generator of (low, segment) pairs covering the odd numbers below limit.
+
+    Without a limit the segments go on forever, growing the base primes
+    as the sieve moves forward.
+    """
+    low = 1
+    primes: List[int] = []
+    bound = 0
+    while limit is None or low < limit:
+        high = low + 2 * SEGMENT_SIZE
+        if limit is not None and high > limit:
+            high = limit
+        if bound * bound < high:
+            bound = isqrt(high) + 1
+            primes = _base_primes(bound)
+        yield low, _sieve_segment(low, high, primes)
+        low = high if high & 1 else high + 1
+
+
+def iter_primes() -> Iterator[int]:
+    """
+    Infinite prime numbers generator backed by a segmented sieve.
+
+    Yields:
+        int: The next prime number in ascending order
+    """
+    yield 2
+    for low, segment in _segments():
+        yield from compress(count(low, 2), segment)
+
+
+def primes_below(n: int) -> List[int]:
+    """
+    Returns every prime strictly below n.
+    """
+    if n <= 2:
+        return []
+    result = [2]
+    for low, segment in _segments(n):
+        result.extend(compress(range(low, low + 2 * len(segment), 2),
+                               segment))
+    return result
+
+
+def prime_count(n: int) -> int:
+    """
+    Returns the number of primes <= n.
+    """
+    if n < 2:
+        return 0
+    return 1 + sum(segment.count(1) for _, segment in _segments(n + 1))
+
+
+def nth_prime(k: int) -> int:
+    """
+    Returns the k-th prime, nth_prime(1) being 2.
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer")
+    if k == 1:
+        return 2
+    if k < 6:
+        limit = 15
+    else:
+        limit = int(k * (log(k) + log(log(k)))) + 1
+    remaining = k - 1
+    for low, segment in _segments(limit):
+        found = segment.count(1)
+        if found >= remaining:
+            for i in compress(count(), segment):
+                remaining -= 1
+                if remaining == 0:
+                    return low + 2 * i
+        remaining -= found
+    raise ValueError(f"no prime found below {limit} for k={k}")
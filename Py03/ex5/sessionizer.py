@@ -0,0 +1,173 @@
+from heapq import heapify, heappop, heappush
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from event_record import to_record
+
+SESSION_TIMEOUT = 2 * 3600
+LATE_TOLERANCE = 300
+
+
+class SessionRecord(NamedTuple):
+    """
+    A closed player session.
+    """
+    player: str
+    start: int
+    end: int
+    events: int
+    score_delta: int
+    reason: str
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+
+class _OpenSession:
+    """
+    Running totals of a session that has not been closed yet.
+    """
+
+    __slots__ = ("start", "last", "events", "score", "entry")
+
+    def __init__(self, ts: int) -> None:
+        self.start = ts
+        self.last = ts
+        self.events = 0
+        self.score = 0
+        self.entry = None
+
+
+class Sessionizer:
+    """
+    Streaming sessionizer pairing login and logout events per player.
+
+    Only the open sessions are kept, in a dict keyed by player, so memory
+    follows the number of active players and not the event history. Each
+    open session has a single entry in the deadline heap, moved forward
+    lazily when it comes due; entries of closed sessions are purged once
+    they outnumber the open sessions.
+    Events may arrive up to `tolerance` seconds late; older ones are
+    dropped and counted in `late`. A session with no event for `timeout`
+    seconds is closed with the reason "timeout".
+    """
+
+    def __init__(self, timeout: int = SESSION_TIMEOUT,
+                 tolerance: int = LATE_TOLERANCE) -> None:
+        """
+        Initialize a sessionizer with no open session.
+        """
+        self.timeout = timeout
+        self.tolerance = tolerance
+        self.open: Dict[str, _OpenSession] = {}
+        self.watermark = None
+        self.late = 0
+        self._deadlines: List[Tuple[int, str]] = []
+        self._stale = 0
+
+    def _close(self, player: str, reason: str) -> SessionRecord:
+        session = self.open.pop(player)
+        if session.entry is not None:
+            self._stale += 1
+        if self._stale > len(self.open):
+            self._purge()
+        return SessionRecord(player, session.start, session.last,
+                             session.events, session.score, reason)
+
+    def _live(self, entry: Tuple[int, str]) -> bool:
+        session = self.open.get(entry[1])
+        return session is not None and session.entry is entry
+
+    def _purge(self) -> None:
+        """
+        Drop the heap entries of closed sessions.
+        """
+        self._deadlines = [entry for entry in self._deadlines
+                           if self._live(entry)]
+        heapify(self._deadlines)
+        self._stale = 0
+
+    def _schedule(self, player: str, session: _OpenSession) -> None:
+        session.entry = (session.last + self.timeout, player)
+        heappush(self._deadlines, session.entry)
+
+    def _expire(self) -> List[SessionRecord]:
+        """
+        Close the sessions whose deadline fell behind the watermark.
+        """
+        closed = []
+        horizon = self.watermark - self.tolerance
+        while self._deadlines and self._deadlines[0][0] < horizon:
+            entry = heappop(self._deadlines)
+            player = entry[1]
+            if not self._live(entry):
+                self._stale -= 1
+                continue
+            session = self.open[player]
+            if session.last + self.timeout > entry[0]:
+                self._schedule(player, session)
+            else:
+                session.entry = None
+                closed.append(self._close(player, "timeout"))
+        return closed
+
+    def feed(self, event: Any) -> List[SessionRecord]:
+        """
+        Account one event and return the sessions it caused to close.
+        """
+        event = to_record(event)
+        ts = event.ts
+        if self.watermark is not None and ts < self.watermark - self.tolerance:
+            self.late += 1
+            return []
+        closed = []
+        if self.watermark is None or ts > self.watermark:
+            self.watermark = ts
+            closed = self._expire()
+
+        player = event.player
+        session = self.open.get(player)
+        if session is not None and (event.event_type == "login"
+                                    or ts - session.last > self.timeout):
+            reason = "relogin" if event.event_type == "login" else "timeout"
+            closed.append(self._close(player, reason))
+            session = None
+        if session is None:
+            session = self.open[player] = _OpenSession(ts)
+
+        session.events += 1
+        session.score += event.score_delta
+        if ts < session.start:
+            session.start = ts
+        if ts > session.last:
+            session.last = ts
+
+        if event.event_type == "logout":
+            closed.append(self._close(player, "logout"))
+        elif session.entry is None:
+            self._schedule(player, session)
+        return closed
+
+    def flush(self) -> List[SessionRecord]:
+        """
+        Close every session still open, at the end of the stream.
+        """
+        self._deadlines = []
+        self._stale = 0
+        return [self._close(player, "end_of_stream")
+                for player in list(self.open)]
+
+
+def sessionize(events: Iterable[Dict[str, Any]],
+               timeout: int = SESSION_TIMEOUT,
+               tolerance: int = LATE_TOLERANCE) -> Iterator[SessionRecord]:
+    """
+    Generator of the sessions found in an event stream.
+
+    Yields:
+        SessionRecord: The next session, in closing order
+    """
+    sessionizer = Sessionizer(timeout, tolerance)
+    for event in events:
+        yield from sessionizer.feed(event)
+    yield from sessionizer.flush()
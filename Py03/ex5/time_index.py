@@ -0,0 +1,114 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+HOUR = 3600
+DAY = 86400
+
+Timestamp = Union[int, str]
+
+
+def parse_timestamp(value: Timestamp) -> int:
+    """
+    Converts an ISO timestamp such as "2024-01-01T23:17" to epoch seconds.
+
+    Timestamps without an offset are read as UTC; ints are returned as is.
+    """
+    if isinstance(value, int):
+        return value
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class TimeIndex:
+    """
+    Sorted index of events by timestamp answering range queries with
+    binary search.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]] = ()) -> None:
+        """
+        Initialize the index, parsing every timestamp exactly once.
+        """
+        pairs = sorted(((parse_timestamp(e["timestamp"]), e) for e in events),
+                       key=lambda pair: pair[0])
+        self.times: List[int] = [t for t, _ in pairs]
+        self.events: List[Dict[str, Any]] = [e for _, e in pairs]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def add(self, event: Dict[str, Any]) -> int:
+        """
+        Insert a new event, appending when it arrives in order.
+        """
+        ts = parse_timestamp(event["timestamp"])
+        if not self.times or ts >= self.times[-1]:
+            self.times.append(ts)
+            self.events.append(event)
+        else:
+            pos = bisect_right(self.times, ts)
+            self.times.insert(pos, ts)
+            self.events.insert(pos, event)
+        return ts
+
+    def _bounds(self, start: Timestamp, end: Timestamp) -> Tuple[int, int]:
+        return (bisect_left(self.times, parse_timestamp(start)),
+                bisect_left(self.times, parse_timestamp(end)))
+
+    def count_range(self, start: Timestamp, end: Timestamp) -> int:
+        """
+        Number of events with start <= timestamp < end.
+        """
+        lo, hi = self._bounds(start, end)
+        return hi - lo
+
+    def range(self, start: Timestamp,
+              end: Timestamp) -> List[Dict[str, Any]]:
+        """
+        Events with start <= timestamp < end, in time order.
+        """
+        lo, hi = self._bounds(start, end)
+        return self.events[lo:hi]
+
+
+class TimeRollup:
+    """
+    Time-bucketed event counts and score sums, updated incrementally.
+    """
+
+    def __init__(self, bucket: int = HOUR) -> None:
+        """
+        Initialize an empty rollup with buckets of the given seconds.
+        """
+        self.bucket = bucket
+        self.buckets: Dict[int, List[int]] = {}
+
+    def add(self, event: Dict[str, Any]) -> None:
+        """
+        Account a new event into its bucket.
+        """
+        ts = parse_timestamp(event["timestamp"])
+        key = ts - ts % self.bucket
+        slot = self.buckets.get(key)
+        if slot is None:
+            slot = self.buckets[key] = [0, 0]
+        slot[0] += 1
+        slot[1] += event["data"]["score_delta"]
+
+    def update(self, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Account every event of an iterable.
+        """
+        for event in events:
+            self.add(event)
+
+    def rollup(self) -> List[Tuple[str, int, int]]:
+        """
+        Returns (bucket start ISO, count, score sum) in time order.
+        """
+        return [(datetime.fromtimestamp(key, timezone.utc)
+                 .strftime("%Y-%m-%dT%H:%M"), count, score)
+                for key, (count, score) in sorted(self.buckets.items())]
@@ -0,0 +1,135 @@
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Set, Tuple
+
+HIGH_SCORE = 5000
+MEDIUM_SCORE = 2000
+REQUIRED_FIELDS = ("total_score", "favorite_mode")
+
+
+def score_category(score: int) -> str:
+    """
+    Returns the dashboard category of a total_score.
+
+    - high: total_score >= 5000
+    - medium: 2000 <= total_score < 5000
+    - low: total_score < 2000
+    """
+    if score >= HIGH_SCORE:
+        return "high"
+    if score >= MEDIUM_SCORE:
+        return "medium"
+    return "low"
+
+
+class AnalyticsIndex:
+    """
+    Aggregate indexes over the players table, built in a single pass and
+    patched incrementally when a player changes.
+
+    - scores: (total_score, player) pairs kept sorted
+    - categories: players bucketed into high, medium and low
+    - modes: players grouped by favorite_mode
+    """
+
+    def __init__(self, players: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Build every index with one scan of the players table.
+        """
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self.scores: List[Tuple[int, str]] = []
+        self.categories: Dict[str, Set[str]] = {
+            "high": set(), "medium": set(), "low": set()
+        }
+        self.modes: Dict[str, Set[str]] = {}
+        self.total_score = 0
+        for name, player in players.items():
+            self._add(name, player, sort=False)
+        self.scores.sort()
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _add(self, name: str, player: Dict[str, Any],
+             sort: bool = True) -> None:
+        score = player["total_score"]
+        self.players[name] = dict(player)
+        if sort:
+            insort(self.scores, (score, name))
+        else:
+            self.scores.append((score, name))
+        self.categories[score_category(score)].add(name)
+        self.modes.setdefault(player["favorite_mode"], set()).add(name)
+        self.total_score += score
+
+    def _remove(self, name: str) -> Dict[str, Any]:
+        player = self.players.pop(name)
+        score = player["total_score"]
+        del self.scores[bisect_left(self.scores, (score, name))]
+        self.categories[score_category(score)].discard(name)
+        mode = self.modes[player["favorite_mode"]]
+        mode.discard(name)
+        if not mode:
+            del self.modes[player["favorite_mode"]]
+        self.total_score -= score
+        return player
+
+    def update_player(self, name: str, **fields: Any) -> None:
+        """
+        Insert a player or patch some of its fields, in O(log n) plus the
+        cost of shifting the sorted score array. A new player must come
+        with every REQUIRED_FIELDS entry; the index is left untouched
+        otherwise.
+        """
+        missing = [field for field in REQUIRED_FIELDS
+                   if field not in fields and field not in
+                   self.players.get(name, {})]
+        if missing:
+            raise ValueError(f"player {name!r} is missing "
+                             f"{', '.join(missing)}")
+        player = self._remove(name) if name in self.players else {}
+        player.update(fields)
+        self._add(name, player)
+
+    def remove_player(self, name: str) -> None:
+        """
+        Drop a player from every index.
+        """
+        self._remove(name)
+
+    def category_counts(self) -> Dict[str, int]:
+        """
+        Number of players in each score category, in O(1).
+        """
+        return {category: len(names)
+                for category, names in self.categories.items()}
+
+    def count_above(self, score: int) -> int:
+        """
+        Number of players whose total_score is strictly above score.
+        """
+        return len(self.scores) - bisect_left(self.scores, (score + 1, ""))
+
+    def players_above(self, score: int) -> List[str]:
+        """
+        Players whose total_score is strictly above score, lowest first.
+        """
+        start = bisect_left(self.scores, (score + 1, ""))
+        return [name for _, name in self.scores[start:]]
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        The k best (player, total_score) pairs, best first.
+        """
+        return [(name, score) for score, name in self.scores[:-k - 1:-1]]
+
+    def by_mode(self, mode: str) -> Set[str]:
+        """
+        Players whose favorite_mode is mode.
+        """
+        return self.modes.get(mode, set())
+
+    def average_score(self) -> float:
+        """
+        Average total_score over every player, in O(1).
+        """
+        return self.total_score / len(self.players) if self.players else 0.0
@@ -1,3 +1,11 @@
+import sys
+from heapq import nlargest
+
+from analytics_index import AnalyticsIndex, score_category
+from leaderboard import from_players
+from player_store import PlayerStore
+from session_ingest import SessionIngestor
+
 GameData = {
     "players": {
         "alice": {
@@ -65,11 +73,53 @@ GameData = {
 }
 
 
+_index = None
+_leaderboard = None
+
+
+def get_index():
+    """
+    Returns the AnalyticsIndex over GameData["players"], building it with
+    a single scan on first use.
+    """
+    global _index
+    if _index is None:
+        _index = AnalyticsIndex(GameData["players"])
+    return _index
+
+
+def get_leaderboard():
+    """
+    Returns the Leaderboard ranking GameData["players"] by total_score.
+    """
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = from_players(GameData["players"].items())
+    return _leaderboard
+
+
+def ingest_sessions(sessions, batch_size=1024):
+    """
+    Feeds session records back into GameData["players"].
+
+    Each session adds its score to the player's total_score and counts as
+    one more session played. Only the affected players are patched in the
+    cached index and leaderboard, which are not rebuilt.
+
+    Returns:
+        int: The number of players whose totals changed
+    """
+    ingestor = SessionIngestor(GameData["players"], GameData["sessions"],
+                               _index, _leaderboard, batch_size)
+    return ingestor.ingest(sessions)
+
+
 def list_comprehension():
     """
     Demonstrates list comprehension usage.
 
-    - hights_scores: List of players whose total_score > 2000
+    - hights_scores: List of players whose total_score > 2000, best
+      first, read from the sorted scores of the AnalyticsIndex
     - Scores_doubled: List of those players' scores multiplied by 2
     - Active_players: List of all players in the dataset
 
@@ -79,10 +129,10 @@ def list_comprehension():
     - Active players
     """
     players = GameData["players"]
-    hights_scores = [player for player in players
-                     if players[player]['total_score'] > 2000]
-    Scores_doubled = [players[player]['total_score'] * 2 for player in players
-                      if players[player]['total_score'] > 2000]
+    index = get_index()
+    hights_scores = index.players_above(2000)[::-1]
+    Scores_doubled = [index.players[player]['total_score'] * 2
+                      for player in hights_scores]
     Active_players = [player for player in players]
 
     print(f"High scorers (>2000): {hights_scores}")
@@ -98,8 +148,9 @@ def dict_comprehension():
     - achievements_count: Maps each player to their achievements_count
     - Score categories:
         * high: total_score >= 5000
-        * medium: 2000 <= total_score <= 5000
+        * medium: 2000 <= total_score < 5000
         * low: total_score < 2000
+      The category counts come from the precomputed AnalyticsIndex.
 
     Prints:
     - Player scores dictionary
@@ -107,12 +158,7 @@ def dict_comprehension():
     - Player achievement counts
     """
     players = GameData["players"]
-    high = sum(1 for player in players
-               if players[player]['total_score'] >= 5000)
-    medium = sum(1 for player in players
-                 if players[player]['total_score'] >= 2000 and
-                 players[player]['total_score'] <= 5000)
-    low = sum(1 for player in players if players[player]['total_score'] < 2000)
+    categories = get_index().category_counts()
 
     Player_scores = {player:  players[player]['total_score']
                      for player in players}
@@ -121,8 +167,7 @@ def dict_comprehension():
                           for player in players}
 
     print(f"Unique players: {Player_scores}")
-    print(f"Score categories: "
-          f"{dict({'high': high, 'medium': medium, 'low': low})}")
+    print(f"Score categories: {categories}")
     print(f"Achievement counts: {achievements_count}\n")
 
 
@@ -148,7 +193,43 @@ def set_comprehension():
     print(f"Active regions: {set(meta['game_modes'])}\n")
 
 
+def store_dashboard(path):
+    """
+    Prints the dashboard of an on-disk player store.
+
+    The store is memory-mapped, so every figure comes from a scan of the
+    needed columns without building a Python dict per player.
+    """
+    with PlayerStore(path) as store:
+        scores = store.column("total_score")
+        modes = store.column("favorite_mode")
+
+        categories = {"high": 0, "medium": 0, "low": 0}
+        for score in scores:
+            categories[score_category(score)] += 1
+        mode_counts = {}
+        for mode in modes:
+            mode_counts[mode] = mode_counts.get(mode, 0) + 1
+        mode_counts = {store.string(mode): count
+                       for mode, count in mode_counts.items()}
+        top = [(store.string(store.column("name")[i]), scores[i])
+               for i in nlargest(3, range(len(store)),
+                                 key=scores.__getitem__)]
+
+        print(f"Total players: {len(store)}")
+        print(f"Score categories: {categories}")
+        print(f"Players per mode: {mode_counts}")
+        if len(store):
+            print(f"Average score: {sum(scores) / len(store)}")
+        print(f"Top 3: {top}\n")
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(f"=== Player Store Dashboard: {sys.argv[1]} ===\n")
+        store_dashboard(sys.argv[1])
+        sys.exit(0)
+
     print("=== Game Analytics Dashboard ===\n")
 
     print("=== List Comprehension Examples ===")
@@ -160,16 +241,29 @@ if __name__ == "__main__":
     print("=== Set Comprehension Examples ===")
     set_comprehension()
 
+    print("=== Session Ingestion ===")
+    get_index()
+    get_leaderboard()
+    changed = ingest_sessions([
+        {"player": "diana", "duration_minutes": 41, "score": 2210,
+         "mode": "casual", "completed": True},
+        {"player": "eve", "duration_minutes": 77, "score": 3905,
+         "mode": "ranked", "completed": True},
+        {"player": "diana", "duration_minutes": 12, "score": 640,
+         "mode": "casual", "completed": False},
+    ])
+    print(f"Players updated: {changed}")
+    print(f"Score categories: {get_index().category_counts()}")
+    print(f"Top 3: {get_leaderboard().top(3)}\n")
+
     print("=== Generator Demonstration ===")
     print(f"Total players: {len(GameData['players'])}")
     print(f"Total unique achievements: "
           f"{len(GameData['meta']['achievements'])}")
-    players = GameData["players"]
-    avrage_scor = sum(players[player]['total_score'] for player in players)
-    print(f"Average score: "
-          f"{avrage_scor / len(GameData['meta']['achievements'])}")
+    print(f"Average score: {get_index().average_score()}")
+    top_name, top_score = get_leaderboard().top(1)[0]
     print(
-        f"Top performer: alice "
-        f"({GameData['players']['alice']['total_score']} points, "
-        f"{GameData['players']['alice']['achievements_count']} achievements)"
+        f"Top performer: {top_name} "
+        f"({top_score} points, "
+        f"{GameData['players'][top_name]['achievements_count']} achievements)"
     )
@@ -0,0 +1,179 @@
+from math import ceil
+from random import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAX_LEVEL = 32
+
+
+class _Node:
+    """
+    Skip-list node; width[i] counts the level-0 steps up to next[i].
+    """
+
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Tuple[float, str], level: int) -> None:
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level
+
+
+_NIL = _Node((float("inf"), ""), 0)
+
+
+class Leaderboard:
+    """
+    Ranking of players by total_score backed by an indexable skip list.
+
+    Players are ordered best first on (-score, player), so score updates,
+    rank_of and percentile queries run in O(log n) and top(k) in
+    O(log n + k).
+    """
+
+    def __init__(self, scores: Optional[Dict[str, int]] = None) -> None:
+        """
+        Initialize the leaderboard, optionally from a player -> score map.
+        """
+        self.head = _Node(("HEAD", ""), MAX_LEVEL)
+        self.head.next = [_NIL] * MAX_LEVEL
+        self.scores: Dict[str, int] = {}
+        if scores:
+            for player, score in scores.items():
+                self.update(player, score)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __contains__(self, player: str) -> bool:
+        return player in self.scores
+
+    def _insert(self, key: Tuple[int, str]) -> None:
+        chain = [self.head] * MAX_LEVEL
+        steps_at_level = [0] * MAX_LEVEL
+        node = self.head
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.next[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        height = 1
+        while height < MAX_LEVEL and random() < 0.5:
+            height += 1
+        new = _Node(key, height)
+        steps = 0
+        for level in range(height):
+            prev = chain[level]
+            new.next[level] = prev.next[level]
+            prev.next[level] = new
+            new.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, MAX_LEVEL):
+            chain[level].width[level] += 1
+
+    def _delete(self, key: Tuple[int, str]) -> None:
+        chain = [self.head] * MAX_LEVEL
+        node = self.head
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        height = len(target.next)
+        for level in range(height):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(height, MAX_LEVEL):
+            chain[level].width[level] -= 1
+
+    def update(self, player: str, score: int) -> None:
+        """
+        Set the score of a player, inserting it when it is new.
+        """
+        old = self.scores.get(player)
+        if old is not None:
+            if old == score:
+                return
+            self._delete((-old, player))
+        self.scores[player] = score
+        self._insert((-score, player))
+
+    def add(self, player: str, delta: int) -> int:
+        """
+        Add delta to the score of a player and return the new score.
+        """
+        score = self.scores.get(player, 0) + delta
+        self.update(player, score)
+        return score
+
+    def remove(self, player: str) -> None:
+        """
+        Drop a player from the leaderboard.
+        """
+        self._delete((-self.scores.pop(player), player))
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        The k best (player, score) pairs, best first.
+        """
+        result = []
+        node = self.head.next[0]
+        while node is not _NIL and len(result) < k:
+            result.append((node.key[1], -node.key[0]))
+            node = node.next[0]
+        return result
+
+    def at_rank(self, rank: int) -> Tuple[str, int]:
+        """
+        The (player, score) pair at a 1-based rank.
+        """
+        if not 1 <= rank <= len(self.scores):
+            raise IndexError(f"rank {rank} out of range")
+        node = self.head
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.width[level] <= rank:
+                rank -= node.width[level]
+                node = node.next[level]
+            if rank == 0:
+                break
+        return node.key[1], -node.key[0]
+
+    def rank_of(self, player: str) -> int:
+        """
+        1-based rank of a player, 1 being the best score.
+        """
+        key = (-self.scores[player], player)
+        rank = 0
+        node = self.head
+        for level in range(MAX_LEVEL - 1, -1, -1):
+            while node.next[level].key <= key:
+                rank += node.width[level]
+                node = node.next[level]
+        return rank
+
+    def percentile_of(self, player: str) -> float:
+        """
+        Percentage of players ranked at or below player (best is 100).
+        """
+        n = len(self.scores)
+        return 100 * (n - self.rank_of(player) + 1) / n
+
+    def score_at_percentile(self, percentile: float) -> int:
+        """
+        Lowest score still within the given percentile from the bottom,
+        so score_at_percentile(50) is the median score.
+        """
+        n = len(self.scores)
+        below = min(max(ceil(percentile * n / 100), 1), n)
+        return self.at_rank(n - below + 1)[1]
+
+
+def from_players(players: Iterable[Tuple[str, Dict]]) -> Leaderboard:
+    """
+    Build a Leaderboard from (name, player) pairs keyed on total_score.
+    """
+    return Leaderboard({name: player["total_score"]
+                        for name, player in players})
@@ -0,0 +1,196 @@
+import json
+import mmap
+import os
+from array import array
+from typing import Any, Dict, Iterator, Tuple
+
+CHUNK_ROWS = 65536
+
+# field -> (array typecode, True when the column holds string ids)
+COLUMNS: Dict[str, Tuple[str, bool]] = {
+    "name": ("I", True),
+    "level": ("i", False),
+    "total_score": ("q", False),
+    "sessions_played": ("i", False),
+    "favorite_mode": ("I", True),
+    "achievements_count": ("i", False),
+}
+
+
+class PlayerStoreWriter:
+    """
+    Streams players into a directory of fixed-width column files.
+
+    Every field of COLUMNS gets its own <field>.col file; names and modes
+    are stored as ids into a string dictionary made of strings.dat (the
+    UTF-8 bytes) and strings.off (int64 offsets into strings.dat).
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Create the store directory and open every column for writing.
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.rows = 0
+        self.buffers = {field: array(code)
+                        for field, (code, _) in COLUMNS.items()}
+        self.files = {field: open(os.path.join(path, f"{field}.col"), "wb")
+                      for field in COLUMNS}
+        self.string_ids: Dict[str, int] = {}
+        self.strings = open(os.path.join(path, "strings.dat"), "wb")
+        self.offsets = array("q", [0])
+        self.string_size = 0
+
+    def __enter__(self) -> "PlayerStoreWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _intern(self, value: str) -> int:
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = self.string_ids[value] = len(self.string_ids)
+            data = value.encode("utf-8")
+            self.strings.write(data)
+            self.string_size += len(data)
+            self.offsets.append(self.string_size)
+        return string_id
+
+    def add(self, name: str, player: Dict[str, Any]) -> None:
+        """
+        Append one player row.
+        """
+        for field, (_, is_string) in COLUMNS.items():
+            value = name if field == "name" else player[field]
+            self.buffers[field].append(
+                self._intern(value) if is_string else value)
+        self.rows += 1
+        if self.rows % CHUNK_ROWS == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        for field, buffer in self.buffers.items():
+            buffer.tofile(self.files[field])
+            del buffer[:]
+
+    def close(self) -> None:
+        """
+        Flush the last rows and write the dictionary offsets and meta.
+        """
+        if self.strings.closed:
+            return
+        self._flush()
+        for f in self.files.values():
+            f.close()
+        self.strings.close()
+        with open(os.path.join(self.path, "strings.off"), "wb") as f:
+            self.offsets.tofile(f)
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump({"rows": self.rows, "strings": len(self.string_ids),
+                       "columns": {field: code
+                                   for field, (code, _) in COLUMNS.items()}},
+                      f)
+
+
+def save_store(path: str, players: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Write a players table to a column store and return its row count.
+    """
+    with PlayerStoreWriter(path) as writer:
+        for name, player in players.items():
+            writer.add(name, player)
+    return writer.rows
+
+
+class PlayerStore:
+    """
+    Read-only, memory-mapped view of a column store.
+
+    Opening only maps the files: columns are exposed as typed memoryviews
+    over the mappings and strings are decoded one at a time on demand.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map every column and the string dictionary of the store.
+        """
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        self.path = path
+        self.rows: int = meta["rows"]
+        self._maps = []
+        self.columns = {field: self._map(f"{field}.col", code)
+                        for field, code in meta["columns"].items()}
+        self._string_fields = {field for field, (_, is_string)
+                               in COLUMNS.items() if is_string}
+        self._strings = self._map("strings.dat", "B")
+        self._offsets = self._map("strings.off", "q")
+
+    def _map(self, filename: str, code: str) -> memoryview:
+        with open(os.path.join(self.path, filename), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(array(code))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(code)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> "PlayerStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memoryviews and unmap the files; a file still viewed
+        through a slice kept by the caller is unmapped by the garbage
+        collector once that slice is gone.
+        """
+        for view in self.columns.values():
+            view.release()
+        self._strings.release()
+        self._offsets.release()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps = []
+
+    def column(self, field: str) -> memoryview:
+        """
+        Zero-copy view of a whole column.
+        """
+        return self.columns[field]
+
+    def string(self, string_id: int) -> str:
+        """
+        Decode one entry of the string dictionary.
+        """
+        start = self._offsets[string_id]
+        end = self._offsets[string_id + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def row(self, i: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Materialize row i as a (name, player) pair.
+        """
+        player = {}
+        for field, view in self.columns.items():
+            value = view[i]
+            if field in self._string_fields:
+                value = self.string(value)
+            player[field] = value
+        return player.pop("name"), player
+
+    def rows_iter(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Generator of every (name, player) pair, one row at a time.
+        """
+        for i in range(self.rows):
+            yield self.row(i)
@@ -0,0 +1,96 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from analytics_index import AnalyticsIndex
+from leaderboard import Leaderboard
+
+BATCH_SIZE = 1024
+
+
+class SessionIngestor:
+    """
+    Applies session records to the players table in batches.
+
+    Sessions of a batch are folded into one score / session delta per
+    player first, then only the affected players are patched in the table
+    and in the cached AnalyticsIndex and Leaderboard when given.
+    """
+
+    def __init__(self, players: Dict[str, Dict[str, Any]],
+                 sessions: Optional[List[Dict[str, Any]]] = None,
+                 index: Optional[AnalyticsIndex] = None,
+                 leaderboard: Optional[Leaderboard] = None,
+                 batch_size: int = BATCH_SIZE) -> None:
+        """
+        Initialize an ingestor writing into the given players table.
+        """
+        self.players = players
+        self.sessions = sessions
+        self.index = index
+        self.leaderboard = leaderboard
+        self.batch_size = batch_size
+        self.pending: Dict[str, List[Any]] = {}
+        self.pending_count = 0
+        self.applied = 0
+        self._changed: Optional[Set[str]] = None
+
+    def add(self, session: Dict[str, Any]) -> None:
+        """
+        Queue one session record, flushing when the batch is full.
+        """
+        delta = self.pending.get(session["player"])
+        if delta is None:
+            delta = self.pending[session["player"]] = [0, 0, session["mode"]]
+        delta[0] += session["score"]
+        delta[1] += 1
+        if self.sessions is not None:
+            self.sessions.append(session)
+        self.pending_count += 1
+        if self.pending_count >= self.batch_size:
+            self.flush()
+
+    def ingest(self, sessions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Queue and apply every session of an iterable.
+
+        Returns:
+            int: The number of players whose totals changed
+        """
+        self._changed = set()
+        try:
+            for session in sessions:
+                self.add(session)
+            self.flush()
+            return len(self._changed)
+        finally:
+            self._changed = None
+
+    def flush(self) -> int:
+        """
+        Apply the pending batch.
+
+        Returns:
+            int: The number of players whose totals changed
+        """
+        for name, (score, played, mode) in self.pending.items():
+            player = self.players.get(name)
+            if player is None:
+                player = self.players[name] = {
+                    "level": 1,
+                    "total_score": 0,
+                    "sessions_played": 0,
+                    "favorite_mode": mode,
+                    "achievements_count": 0,
+                }
+            player["total_score"] += score
+            player["sessions_played"] += played
+            if self.index is not None:
+                self.index.update_player(name, **player)
+            if self.leaderboard is not None:
+                self.leaderboard.update(name, player["total_score"])
+        changed = len(self.pending)
+        if self._changed is not None:
+            self._changed.update(self.pending)
+        self.applied += self.pending_count
+        self.pending = {}
+        self.pending_count = 0
+        return changed
@@ -0,0 +1,134 @@
+import sys
+
+STARTUP_BUDGET_MS = 15.0
+
+
+def _read_tokens(source):
+    if source == "-":
+        return sys.stdin.read().split()
+    with open(source, "r") as f:
+        return f.read().split()
+
+
+def expand_args(args):
+    """
+    Returns args with every @file argument replaced by its tokens.
+    """
+    if not any(arg.startswith("@") for arg in args):
+        return list(args)
+    expanded = []
+    for arg in args:
+        if arg.startswith("@") and len(arg) > 1:
+            expanded.extend(_read_tokens(arg[1:]))
+        else:
+            expanded.append(arg)
+    return expanded
+
+
+def _invoke(main, prog, args):
+    """
+    Calls main on the expanded args; an unreadable @file is a usage
+    error (status 2).
+    """
+    try:
+        args = expand_args(args)
+    except OSError as e:
+        print(f"{prog}: cannot read argument file: {e}", file=sys.stderr)
+        return 2
+    return main([prog] + args) or 0
+
+
+def run_batch(main, prog, source="-"):
+    """
+    Runs main once per line of source, in this process.
+
+    A line that fails (bad quoting, or an exception raised by main) is
+    reported on stderr with status 1 and the batch goes on; an unreadable
+    source is a usage error (status 2).
+
+    Returns:
+        int: The highest exit status of the invocations
+    """
+    import shlex
+
+    status = 0
+    try:
+        f = sys.stdin if source == "-" else open(source, "r")
+    except OSError as e:
+        print(f"{prog}: cannot read batch file: {e}", file=sys.stderr)
+        return 2
+    try:
+        for number, line in enumerate(f, 1):
+            try:
+                args = shlex.split(line)
+                if args:
+                    status = max(status, _invoke(main, prog, args))
+            except Exception as e:
+                print(f"{prog}: line {number}: {type(e).__name__}: {e}",
+                      file=sys.stderr)
+                status = max(status, 1)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    return status
+
+
+def run(main, argv=None):
+    """
+    Entry point of the Py03 tools: expands @files, dispatches --batch,
+    then calls main(argv) and returns its exit status.
+
+    - @file arguments are replaced by the whitespace-separated tokens of
+      file ("@-" reads them from stdin), for argument lists too large
+      for a command line; an unreadable file is a usage error (status 2)
+    - --batch [file]: every line of file (stdin when absent or "-") is
+      one invocation of the tool, all served by the same process
+
+    Only sys is imported up front, the rest when needed, so the layer
+    stays within STARTUP_BUDGET_MS (see bench()).
+    """
+    argv = sys.argv if argv is None else argv
+    prog, args = argv[0], argv[1:]
+    if args and args[0] == "--batch":
+        return run_batch(main, prog, args[1] if len(args) > 1 else "-")
+    return _invoke(main, prog, args)
+
+
+def bench(script, runs=20):
+    """
+    Measures the wall-clock startup of a tool run with no arguments
+    against a bare interpreter, and compares the overhead with
+    STARTUP_BUDGET_MS.
+
+    Returns:
+        float: The median overhead of the tool in milliseconds
+    """
+    import statistics
+    import subprocess
+    import time
+
+    def median_ms(command):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    interpreter = median_ms([sys.executable, "-c", "pass"])
+    tool = median_ms([sys.executable, script])
+    overhead = tool - interpreter
+    verdict = "within" if overhead <= STARTUP_BUDGET_MS else "OVER"
+    print(f"{script}: {tool:.1f} ms (interpreter {interpreter:.1f} ms, "
+          f"overhead {overhead:.1f} ms, {verdict} the "
+          f"{STARTUP_BUDGET_MS:g} ms budget)")
+    return overhead
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--bench":
+        runs = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+        over = bench(sys.argv[2], runs) > STARTUP_BUDGET_MS
+        sys.exit(1 if over else 0)
+    print("Usage: python3 ft_cli.py --bench <tool.py> [runs]")
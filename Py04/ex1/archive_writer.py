@@ -0,0 +1,141 @@
+import os
+import stat
+import tempfile
+from typing import Iterable, Union
+
+BUFFER_SIZE = 1 << 20
+
+
+def _read_umask() -> int:
+    """
+    The process umask, read once at import time: os.umask() can only
+    query it by setting it, which must not race with threads creating
+    files.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+UMASK = _read_umask()
+
+
+def fsync_dir(path: str) -> None:
+    """
+    Persist a rename by syncing the directory holding path, where the
+    platform allows opening directories.
+    """
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def file_mode(path: str) -> int:
+    """
+    Permission bits for a rewrite of path: the current ones when it
+    exists, the umask default otherwise.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+
+def atomic_write(path: str, data: Union[str, Iterable[str]],
+                 encoding: str = "utf-8") -> None:
+    """
+    Replace the content of path atomically.
+
+    The data is written to a temporary file of the same directory, synced
+    to disk, then renamed over path: a crash leaves either the old or the
+    new file, never a torn one.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        os.chmod(tmp, file_mode(path))
+        with os.fdopen(fd, "w", encoding=encoding,
+                       buffering=BUFFER_SIZE) as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                f.writelines(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    fsync_dir(path)
+
+
+class ArchiveWriter:
+    """
+    Append-only archive writer for high-volume entries.
+
+    Entries go through a large write buffer; the file is flushed and
+    fsync'ed every fsync_every entries (never when 0) and on close.
+    """
+
+    def __init__(self, path: str, buffer_size: int = BUFFER_SIZE,
+                 fsync_every: int = 0, encoding: str = "utf-8") -> None:
+        """
+        Open path in append mode, creating it when missing.
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self.file = open(path, "a", encoding=encoding,
+                         buffering=buffer_size)
+        self.written = 0
+        self._pending = 0
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def write(self, entry: str) -> None:
+        """
+        Append one entry, adding the trailing newline.
+        """
+        self.file.write(entry)
+        self.file.write("\n")
+        self.written += 1
+        self._pending += 1
+        if self.fsync_every and self._pending >= self.fsync_every:
+            self.sync()
+
+    def write_many(self, entries: Iterable[str]) -> None:
+        """
+        Append every entry of an iterable.
+        """
+        for entry in entries:
+            self.write(entry)
+
+    def sync(self) -> None:
+        """
+        Flush the buffer and force the entries to disk.
+        """
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        """
+        Sync the remaining entries and close the file.
+        """
+        if not self.file.closed:
+            if self._pending:
+                self.sync()
+            self.file.close()
@@ -0,0 +1,265 @@
+import bz2
+import lzma
+import os
+import struct
+import tempfile
+import zlib
+from bisect import bisect_right
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from archive_writer import file_mode, fsync_dir
+
+MAGIC = b"FTBZ"
+BLOCK_SIZE = 64 << 10
+HEADER = struct.Struct("<4sBBI")
+INDEX_ENTRY = struct.Struct("<QQI")
+TRAILER = struct.Struct("<QQI4s")
+
+Codec = Tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]
+CODECS: Dict[str, Codec] = {
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+    "bz2": (3, bz2.compress, bz2.decompress),
+}
+CODEC_NAMES = {codec[0]: name for name, codec in CODECS.items()}
+
+
+class BlockStoreError(Exception):
+    """
+    For files that are not valid block-compressed archives.
+    """
+    pass
+
+
+def is_compressed(path: str) -> bool:
+    """
+    Whether path starts with the block store magic.
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BlockWriter:
+    """
+    Streaming writer of block-compressed archives.
+
+    Data is cut into block_size raw blocks, each compressed on its own
+    with the chosen codec, so only one block is ever held in memory. The
+    file ends with an index of (raw offset, compressed offset, compressed
+    length) per block and a fixed trailer pointing at it. Everything goes
+    to a temporary file renamed over path on close, like atomic_write.
+    """
+
+    def __init__(self, path: str, codec: str = "zlib",
+                 block_size: int = BLOCK_SIZE) -> None:
+        """
+        Start a new archive at path with one of CODECS.
+        """
+        if codec not in CODECS:
+            raise ValueError(f"unknown codec {codec!r}")
+        self.path = path
+        self.codec_id, self._compress, _ = CODECS[codec]
+        self.block_size = block_size
+        self.index: List[Tuple[int, int, int]] = []
+        self.raw_size = 0
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        fd, self._tmp = tempfile.mkstemp(
+            prefix=".tmp-", dir=os.path.dirname(os.path.abspath(path)))
+        self.file = os.fdopen(fd, "wb")
+        self.file.write(HEADER.pack(MAGIC, 1, self.codec_id, block_size))
+
+    def __enter__(self) -> "BlockWriter":
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> None:
+        """
+        Append raw bytes, compressing every block that fills up.
+        """
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.block_size:
+            buffered = b"".join(self._pending)
+            cut = len(buffered) - len(buffered) % self.block_size
+            for start in range(0, cut, self.block_size):
+                self._flush_block(buffered[start:start + self.block_size])
+            self._pending = [buffered[cut:]]
+            self._pending_size = len(buffered) - cut
+
+    def write_text(self, text: str, encoding: str = "utf-8") -> None:
+        self.write(text.encode(encoding))
+
+    def _flush_block(self, block: bytes) -> None:
+        packed = self._compress(block)
+        self.index.append((self.raw_size, self.file.tell(), len(packed)))
+        self.file.write(packed)
+        self.raw_size += len(block)
+
+    def close(self) -> None:
+        """
+        Compress the last block, write the index and seal the archive.
+        """
+        if self.file.closed:
+            return
+        if self._pending_size:
+            self._flush_block(b"".join(self._pending))
+        self._pending = []
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(INDEX_ENTRY.pack(*entry))
+        self.file.write(TRAILER.pack(index_offset, self.raw_size,
+                                     len(self.index), MAGIC))
+        try:
+            os.chmod(self._tmp, file_mode(self.path))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            os.replace(self._tmp, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        fsync_dir(self.path)
+
+    def abort(self) -> None:
+        """
+        Drop the unfinished archive, leaving path untouched.
+        """
+        self.file.close()
+        try:
+            os.unlink(self._tmp)
+        except FileNotFoundError:
+            pass
+
+
+class BlockReader:
+    """
+    Random-access reader of block-compressed archives.
+
+    Only the index is loaded on open; reads locate their blocks with a
+    bisect over the raw offsets and decompress them one at a time.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open path and load its block index.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            magic, _, codec_id, self.block_size = HEADER.unpack(
+                self.file.read(HEADER.size))
+            self.file.seek(-TRAILER.size, os.SEEK_END)
+            index_offset, self.size, count, end = TRAILER.unpack(
+                self.file.read(TRAILER.size))
+            if magic != MAGIC or end != MAGIC or codec_id not in CODEC_NAMES:
+                raise BlockStoreError(f"{path} is not a block archive")
+            self.codec = CODEC_NAMES[codec_id]
+            self._decompress = CODECS[self.codec][2]
+            self.file.seek(index_offset)
+            self.index = list(INDEX_ENTRY.iter_unpack(
+                self.file.read(count * INDEX_ENTRY.size)))
+        except (struct.error, OSError) as e:
+            self.file.close()
+            raise BlockStoreError(f"{path} is not a block archive") from e
+        except BlockStoreError:
+            self.file.close()
+            raise
+        self.starts = [entry[0] for entry in self.index]
+
+    def __enter__(self) -> "BlockReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def block(self, i: int) -> bytes:
+        """
+        Raw content of block i.
+        """
+        _, offset, length = self.index[i]
+        self.file.seek(offset)
+        try:
+            return self._decompress(self.file.read(length))
+        except (zlib.error, lzma.LZMAError, OSError, EOFError) as e:
+            raise BlockStoreError(
+                f"{self.path}: block {i} is corrupt") from e
+
+    def blocks(self) -> Iterator[bytes]:
+        """
+        Generator of the raw blocks, in order.
+
+        Yields:
+            bytes: The next decompressed block
+        """
+        for i in range(len(self.index)):
+            yield self.block(i)
+
+    def read(self, offset: int = 0, size: Optional[int] = None) -> bytes:
+        """
+        Raw bytes in [offset, offset + size), to the end by default.
+        """
+        stop = self.size if size is None else min(self.size, offset + size)
+        if offset >= stop:
+            return b""
+        parts = []
+        i = bisect_right(self.starts, offset) - 1
+        while i < len(self.index) and self.starts[i] < stop:
+            start = self.starts[i]
+            data = self.block(i)
+            parts.append(data[max(offset - start, 0):stop - start])
+            i += 1
+        return b"".join(parts)
+
+    def lines(self, encoding: str = "utf-8") -> Iterator[str]:
+        """
+        Generator of the lines of the archive, without their newline.
+
+        Yields:
+            str: The next decoded line
+        """
+        tail = b""
+        for data in self.blocks():
+            lines = (tail + data).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                yield line.decode(encoding)
+        if tail:
+            yield tail.decode(encoding)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """
+        Decoded content of the whole archive.
+        """
+        return self.read().decode(encoding)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def write_compressed(path: str, text: str, codec: str = "zlib",
+                     encoding: str = "utf-8") -> None:
+    """
+    Replace path atomically with a block-compressed copy of text.
+    """
+    with BlockWriter(path, codec) as writer:
+        writer.write_text(text, encoding)
+
+
+def read_archive(path: str, encoding: str = "utf-8") -> str:
+    """
+    Content of path, decompressed when it is a block archive.
+    """
+    if is_compressed(path):
+        with BlockReader(path) as reader:
+            return reader.text(encoding)
+    with open(path, "r", encoding=encoding) as f:
+        return f.read()
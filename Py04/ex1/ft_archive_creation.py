@@ -1,31 +1,45 @@
+import sys
 
-def ft_archive_creation():
+from archive_writer import atomic_write
+from block_store import read_archive, write_compressed
+
+
+def ft_archive_creation(codec=None):
     """
         A function that Opening a file in write mode:
 
             - Creates the file if it doesn't exist
             - Erases and replaces its contents if it already exists
+
+        The content is replaced atomically (temp file + rename), so a
+        crash never leaves a half-written archive behind. With a codec
+        ("zlib", "lzma" or "bz2") the archive is stored block-compressed.
     """
-    try:
-        print("Initializing new storage unit: new_discovery.txt\n"
-              "Storage unit created successfully...\n")
-        f = open("new_discovery.txt", "xt")
-    except FileExistsError:
-        f = open("new_discovery.txt", "wt")
-    finally:
-        f.write("Inscribing preservation data...\n"
-                "{[}ENTRY 001{]} New quantum algorithm discovered\n"
-                "{[}ENTRY 002{]} Efficiency increased by 347%\n"
-                "{[}ENTRY 003{]} Archived by Data Archivist trainee")
-        f.close()
+    print("Initializing new storage unit: new_discovery.txt\n"
+          "Storage unit created successfully...\n")
+    data = ("Inscribing preservation data...\n"
+            "{[}ENTRY 001{]} New quantum algorithm discovered\n"
+            "{[}ENTRY 002{]} Efficiency increased by 347%\n"
+            "{[}ENTRY 003{]} Archived by Data Archivist trainee")
+    if codec:
+        write_compressed("new_discovery.txt", data, codec)
+    else:
+        atomic_write("new_discovery.txt", data)
 
 
 if __name__ == "__main__":
     print("=== CYBER ARCHIVES - PRESERVATION SYSTEM ===\n")
-    ft_archive_creation()
-
-    f = open("new_discovery.txt")
-    print(f.read(), "\n")
+    codec = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--codec="):
+            codec = arg[len("--codec="):]
+    try:
+        ft_archive_creation(codec)
+    except (OSError, ValueError) as e:
+        print(f"Storage unit could not be created: {e}")
+    else:
+        print(read_archive("new_discovery.txt"), "\n")
 
-    print("Data inscription complete. Storage unit sealed.\n"
-          "Archive 'new_discovery.txt' ready for long-term preservation.")
+        print("Data inscription complete. Storage unit sealed.\n"
+              "Archive 'new_discovery.txt' ready for long-term "
+              "preservation.")
@@ -0,0 +1,226 @@
+import os
+import struct
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Tuple
+
+SEGMENT_SIZE = 64 << 20
+BUFFER_SIZE = 1 << 20
+READ_CHUNK = 1 << 20
+INDEX_RECORD = struct.Struct("<QI")
+
+
+class ArchiveError(Exception):
+    """
+    A basic error for indexed archive problems.
+    """
+    pass
+
+
+class EntryNotFoundError(ArchiveError, KeyError):
+    """
+    For entry ids outside the archive (inherits from ArchiveError).
+    """
+    pass
+
+
+class IndexedArchive:
+    """
+    Segmented, append-only archive of "[ENTRY n] text" lines.
+
+    Each segment is a pair of files named after the id of its first
+    entry: <base>.log holds the lines and <base>.idx one fixed-width
+    (offset, length) record per entry. Entry ids are dense, so an entry
+    is found by a bisect over the segment bases and a single index read;
+    ranges are streamed through reads of about READ_CHUNK bytes of index
+    and log at a time. A new segment starts once the active one reaches
+    segment_size bytes.
+    """
+
+    def __init__(self, path: str, segment_size: int = SEGMENT_SIZE,
+                 buffer_size: int = BUFFER_SIZE) -> None:
+        """
+        Open or create the archive directory, repairing a torn tail left
+        by a crash in the last segment.
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.segment_size = segment_size
+        self.buffer_size = buffer_size
+        self.bases: List[int] = sorted(
+            int(name[:-4]) for name in os.listdir(path)
+            if name.endswith(".log"))
+        self.counts: Dict[int, int] = {}
+        self._fds: Dict[Tuple[int, str], int] = {}
+        self._log = None
+        self._idx = None
+        if not self.bases:
+            self.bases.append(1)
+        for base in self.bases[:-1]:
+            size = os.path.getsize(self._file(base, "idx"))
+            self.counts[base] = size // INDEX_RECORD.size
+        self._recover(self.bases[-1])
+        self._open_active()
+
+    def _file(self, base: int, kind: str) -> str:
+        return os.path.join(self.path, f"{base:020d}.{kind}")
+
+    def _recover(self, base: int) -> None:
+        log_path = self._file(base, "log")
+        idx_path = self._file(base, "idx")
+        for path in (log_path, idx_path):
+            if not os.path.exists(path):
+                open(path, "wb").close()
+        log_size = os.path.getsize(log_path)
+        with open(idx_path, "rb") as f:
+            data = f.read()
+        count = len(data) // INDEX_RECORD.size
+        end = 0
+        while count:
+            offset, length = INDEX_RECORD.unpack_from(
+                data, (count - 1) * INDEX_RECORD.size)
+            if offset + length <= log_size:
+                end = offset + length
+                break
+            count -= 1
+        os.truncate(idx_path, count * INDEX_RECORD.size)
+        os.truncate(log_path, end)
+        self.counts[base] = count
+
+    def _open_active(self) -> None:
+        base = self.bases[-1]
+        self._log = open(self._file(base, "log"), "ab",
+                         buffering=self.buffer_size)
+        self._idx = open(self._file(base, "idx"), "ab",
+                         buffering=self.buffer_size)
+        self._offset = self._log.tell()
+
+    def __enter__(self) -> "IndexedArchive":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.bases[-1] - 1 + self.counts[self.bases[-1]]
+
+    def next_id(self) -> int:
+        return len(self) + 1
+
+    def append(self, text: str) -> int:
+        """
+        Append one entry and return its id.
+        """
+        if "\n" in text:
+            raise ArchiveError("entries cannot contain newlines")
+        base = self.bases[-1]
+        if self._offset >= self.segment_size and self.counts[base]:
+            self._roll()
+            base = self.bases[-1]
+        entry_id = base + self.counts[base]
+        line = f"[ENTRY {entry_id:03d}] {text}\n".encode("utf-8")
+        self._log.write(line)
+        self._idx.write(INDEX_RECORD.pack(self._offset, len(line)))
+        self._offset += len(line)
+        self.counts[base] += 1
+        return entry_id
+
+    def _roll(self) -> None:
+        self.flush()
+        self._log.close()
+        self._idx.close()
+        self.bases.append(self.next_id())
+        self.counts[self.bases[-1]] = 0
+        self._open_active()
+
+    def flush(self) -> None:
+        """
+        Push the buffered entries to the files.
+        """
+        self._log.flush()
+        self._idx.flush()
+
+    def sync(self) -> None:
+        """
+        Flush and force the active segment to disk.
+        """
+        self.flush()
+        os.fsync(self._log.fileno())
+        os.fsync(self._idx.fileno())
+
+    def close(self) -> None:
+        """
+        Sync the active segment and release every file.
+        """
+        if self._log is None or self._log.closed:
+            return
+        self.sync()
+        self._log.close()
+        self._idx.close()
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds = {}
+
+    def _fd(self, base: int, kind: str) -> int:
+        fd = self._fds.get((base, kind))
+        if fd is None:
+            fd = self._fds[(base, kind)] = os.open(self._file(base, kind),
+                                                   os.O_RDONLY)
+        return fd
+
+    def _segment(self, entry_id: int) -> int:
+        if not 1 <= entry_id <= len(self):
+            raise EntryNotFoundError(entry_id)
+        return self.bases[bisect_right(self.bases, entry_id) - 1]
+
+    def _records(self, base: int, first: int,
+                 count: int) -> List[Tuple[int, int]]:
+        data = os.pread(self._fd(base, "idx"), count * INDEX_RECORD.size,
+                        first * INDEX_RECORD.size)
+        return list(INDEX_RECORD.iter_unpack(data))
+
+    @staticmethod
+    def _text(line: bytes) -> str:
+        return line.decode("utf-8").rstrip("\n").split("] ", 1)[1]
+
+    def get(self, entry_id: int) -> str:
+        """
+        Text of one entry.
+        """
+        base = self._segment(entry_id)
+        if base == self.bases[-1]:
+            self.flush()
+        (offset, length), = self._records(base, entry_id - base, 1)
+        return self._text(os.pread(self._fd(base, "log"), length, offset))
+
+    def range(self, start: int, stop: int) -> Iterator[Tuple[int, str]]:
+        """
+        Generator of the (id, text) entries with start <= id < stop.
+
+        Yields:
+            tuple: The next (id, text) pair in id order
+        """
+        start = max(start, 1)
+        stop = min(stop, len(self) + 1)
+        self.flush()
+        per_chunk = max(READ_CHUNK // INDEX_RECORD.size, 1)
+        entry_id = start
+        while entry_id < stop:
+            base = self._segment(entry_id)
+            last = min(stop, base + self.counts[base], entry_id + per_chunk)
+            records = self._records(base, entry_id - base, last - entry_id)
+            log = self._fd(base, "log")
+            i = 0
+            while i < len(records):
+                first_offset = records[i][0]
+                j = i + 1
+                while (j < len(records)
+                       and records[j][0] + records[j][1] - first_offset
+                       <= READ_CHUNK):
+                    j += 1
+                end = records[j - 1][0] + records[j - 1][1]
+                data = os.pread(log, end - first_offset, first_offset)
+                for offset, length in records[i:j]:
+                    pos = offset - first_offset
+                    yield entry_id, self._text(data[pos:pos + length])
+                    entry_id += 1
+                i = j
@@ -1,3 +1,48 @@
+"""
+Vault Security System
+
+Reads the vault through a read-only memory mapping (vault_map) and
+rewrites it atomically, optionally block-compressed. The atomic write
+and the compressed format are shared with the archive tools of Py04/ex1
+(archive_writer, block_store): that directory is put on sys.path below,
+so ex1 must sit next to this exercise.
+"""
+
+import os
+import sys
+
+EX1_DIR = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "ex1")
+if EX1_DIR not in sys.path:
+    sys.path.insert(0, EX1_DIR)
+
+from archive_writer import atomic_write  # noqa: E402
+from block_store import (  # noqa: E402
+    BlockReader, is_compressed, write_compressed)
+from vault_map import VaultMap  # noqa: E402
+
+
+def read_vault(path):
+    """
+    Content of the vault, through the block reader when it is stored
+    compressed and through a read-only mapping otherwise.
+    """
+    if is_compressed(path):
+        with BlockReader(path) as reader:
+            return reader.text()
+    with VaultMap(path) as vault:
+        return vault.text()
+
+
+def seal_vault(path, text, codec=None):
+    """
+    Replace the vault atomically, block-compressed when codec is given.
+    """
+    if codec:
+        write_compressed(path, text, codec)
+    else:
+        atomic_write(path, text)
+
 
 if __name__ == "__main__":
     print("=== CYBER ARCHIVES - VAULT SECURITY SYSTEM ===\n")
@@ -6,15 +51,20 @@ if __name__ == "__main__":
           "Vault connection established with failsafe protocols\n")
 
     print("SECURE EXTRACTION:")
-    with open("classified_data.txt", "r") as f:
-        print(f.read(), "\n")
+    print(read_vault("classified_data.txt"), "\n")
 
     print("SECURE PRESERVATION:")
-    with open("classified_data.txt", "w") as d:
-        d.write("{[}CLASSIFIED{]} New security protocols archived\n"
-                "Vault automatically sealed upon completion")
-
-    with open("classified_data.txt") as e:
-        print(e.read(), "\n")
+    codec = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--codec="):
+            codec = arg[len("--codec="):]
+    try:
+        seal_vault("classified_data.txt",
+                   "{[}CLASSIFIED{]} New security protocols archived\n"
+                   "Vault automatically sealed upon completion", codec)
+    except (OSError, ValueError) as e:
+        print(f"Vault could not be sealed: {e}\n")
+    else:
+        print(read_vault("classified_data.txt"), "\n")
 
-    print("All vault operations completed with maximum security.")
+        print("All vault operations completed with maximum security.")
@@ -0,0 +1,99 @@
+import mmap
+from typing import Iterator, Optional
+
+
+class VaultMap:
+    """
+    Read-only, memory-mapped view of a vault file.
+
+    The file is never copied into the heap: slices are memoryviews over
+    the mapping and searches run on the mapped pages. Views handed out by
+    slice() and lines() stay valid after close(); the file is unmapped
+    once the last of them is gone.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map path read-only; an empty file maps to an empty view.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self.map: Optional[mmap.mmap] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self.map = None
+        self.view = memoryview(self.map if self.map is not None else b"")
+
+    def __enter__(self) -> "VaultMap":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> memoryview:
+        """
+        Zero-copy view of the bytes in [start, stop).
+        """
+        return self.view[start:stop]
+
+    def text(self, start: int = 0, stop: Optional[int] = None,
+             encoding: str = "utf-8") -> str:
+        """
+        Decoded content of [start, stop), the whole file by default.
+        """
+        return str(self.view[start:stop], encoding)
+
+    def lines(self) -> Iterator[memoryview]:
+        """
+        Generator of the lines of the file, without their newline.
+
+        Yields:
+            memoryview: The next line, as a view over the mapping
+        """
+        end = len(self.view)
+        start = 0
+        while start < end:
+            stop = self.find(b"\n", start)
+            if stop < 0:
+                stop = end
+            yield self.view[start:stop]
+            start = stop + 1
+
+    def find(self, pattern: bytes, start: int = 0) -> int:
+        """
+        Offset of the first occurrence of pattern from start, -1 if none.
+        """
+        if self.map is None:
+            return -1
+        return self.map.find(pattern, start)
+
+    def search(self, pattern: bytes) -> Iterator[int]:
+        """
+        Generator of the offsets of every occurrence of pattern.
+
+        Yields:
+            int: The offset of the next match
+        """
+        if not pattern:
+            return
+        pos = self.find(pattern)
+        while pos >= 0:
+            yield pos
+            pos = self.find(pattern, pos + len(pattern))
+
+    def close(self) -> None:
+        """
+        Release the view and unmap the file, or leave the unmapping to
+        the garbage collector while slices of it are still referenced.
+        """
+        self.view.release()
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                pass
+            self.map = None
@@ -0,0 +1,106 @@
+import errno
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+MISSING = "missing"
+PERMISSION = "permission"
+OK = "ok"
+ERROR = "error"
+
+TRANSIENT_ERRNOS = frozenset((errno.EAGAIN, errno.EINTR, errno.EIO,
+                              errno.EBUSY, errno.ETIMEDOUT, errno.EMFILE,
+                              errno.ENFILE))
+
+
+class RetryPolicy(NamedTuple):
+    """
+    How often and how patiently transient failures are retried: up to
+    attempts tries, waiting delay seconds then delay * backoff, etc.
+    """
+    attempts: int = 3
+    delay: float = 0.01
+    backoff: float = 2.0
+
+
+class AccessResult(NamedTuple):
+    """
+    Outcome of reading one archive: status is OK, MISSING, PERMISSION or
+    ERROR, with the content on success and the error message otherwise.
+    """
+    path: str
+    status: str
+    content: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 1
+
+
+def classify(error: OSError) -> str:
+    """
+    Status of a failed read.
+    """
+    if isinstance(error, FileNotFoundError):
+        return MISSING
+    if isinstance(error, PermissionError):
+        return PERMISSION
+    return ERROR
+
+
+def is_transient(error: OSError) -> bool:
+    """
+    Whether a failed read is worth retrying.
+    """
+    return (isinstance(error, (InterruptedError, BlockingIOError,
+                               TimeoutError))
+            or error.errno in TRANSIENT_ERRNOS)
+
+
+def read_archive(path: str, policy: RetryPolicy = RetryPolicy(),
+                 limit: int = -1, encoding: str = "utf-8") -> AccessResult:
+    """
+    Read up to limit characters of path (all of it when negative),
+    retrying transient failures according to policy.
+    """
+    delay = policy.delay
+    attempt = 1
+    while True:
+        try:
+            with open(path, "r", encoding=encoding) as f:
+                return AccessResult(path, OK, f.read(limit),
+                                    attempts=attempt)
+        except UnicodeDecodeError as e:
+            return AccessResult(path, ERROR, error=str(e), attempts=attempt)
+        except OSError as e:
+            if attempt >= policy.attempts or not is_transient(e):
+                return AccessResult(path, classify(e), error=str(e),
+                                    attempts=attempt)
+        time.sleep(delay)
+        delay *= policy.backoff
+        attempt += 1
+
+
+def read_archives(paths: Iterable[str], workers: int = 32,
+                  policy: RetryPolicy = RetryPolicy(), limit: int = -1,
+                  encoding: str = "utf-8") -> List[AccessResult]:
+    """
+    Read many archives concurrently on a pool of worker threads.
+
+    Returns:
+        list: One AccessResult per path, in the order of paths
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(
+            lambda path: read_archive(path, policy, limit, encoding), paths))
+
+
+def status_counts(results: Iterable[AccessResult]) -> Dict[str, int]:
+    """
+    Number of results per status.
+    """
+    counts = {OK: 0, MISSING: 0, PERMISSION: 0, ERROR: 0}
+    for result in results:
+        counts[result.status] += 1
+    return counts
@@ -1,29 +1,51 @@
+import sys
+
+from bulk_access import (ERROR, MISSING, OK, PERMISSION, read_archives,
+                         status_counts)
+
+SCENARIOS = [
+    ("CRISIS ALERT", "lost_archive.txt"),
+    ("CRISIS ALERT", "classified_vault.txt"),
+    ("ROUTINE ACCESS", "standard_archive.txt"),
+]
+
+RESPONSES = {
+    MISSING: ("RESPONSE: Archive not found in storage matrix",
+              "STATUS: Crisis handled, system stable"),
+    PERMISSION: ("RESPONSE: Security protocols deny access",
+                 "STATUS: Crisis handled, security maintained"),
+    ERROR: ("RESPONSE: Archive damaged beyond recovery",
+            "STATUS: Crisis logged, system stable"),
+}
+
+
+def crisis_report(result):
+    """
+    Prints the response to one archive access.
+    """
+    if result.status == OK:
+        print(f"SUCCESS: Archive recovered - ``{result.content}``")
+        print("STATUS: Normal operations resumed\n")
+    else:
+        response, status = RESPONSES[result.status]
+        print(response)
+        print(f"{status}\n")
+
 
 if __name__ == "__main__":
     print("=== CYBER ARCHIVES - CRISIS RESPONSE SYSTEM ===\n")
 
-    print("CRISIS ALERT: Attempting access to 'lost_archive.txt'...")
-    try:
-        with open("lost_archive.txt", 'r') as f:
-            print(f.read())
-    except FileNotFoundError:
-        print("RESPONSE: Archive not found in storage matrix")
-        print("STATUS: Crisis handled, system stable\n")
-
-    print("CRISIS ALERT: Attempting access to 'classified_vault.txt'...")
-    try:
-        with open("classified_vault.txt", 'r') as e:
-            print(e.read())
-    except PermissionError:
-        print("RESPONSE: Security protocols deny access")
-        print("STATUS: Crisis handled, security maintained\n")
-
-    print("ROUTINE ACCESS: Attempting access to 'standard_archive.txt'...")
-    try:
-        with open("standard_archive.txt", 'r') as d:
-            print(f"SUCCESS: Archive recovered - ``{d.read()}``")
-            print("STATUS: Normal operations resumed\n")
-    except Exception:
-        print("Eroor\n")
+    if len(sys.argv) > 1:
+        scenarios = [("CRISIS ALERT", path) for path in sys.argv[1:]]
+    else:
+        scenarios = SCENARIOS
+    results = read_archives(path for _, path in scenarios)
+    for (alert, path), result in zip(scenarios, results):
+        print(f"{alert}: Attempting access to '{path}'...")
+        crisis_report(result)
 
+    counts = status_counts(results)
+    print(f"Archives scanned: {len(results)} "
+          f"(recovered {counts[OK]}, missing {counts[MISSING]}, "
+          f"denied {counts[PERMISSION]}, damaged {counts[ERROR]})")
     print("All crisis scenarios handled successfully. Archives secure.")